@@ -0,0 +1,90 @@
+import queue
+import threading
+import time
+from grid import Grid, as_grid
+
+PROGRESS_INTERVAL = 0.05  # Seconds between progress events from one solve
+
+class JobCancelled(Exception):
+    """Raised inside a background job once it has been cancelled."""
+
+class BackgroundJob:
+    """
+    Runs work(job, *args) on a daemon thread so the Tk event loop never waits
+    for it. Everything the job has to say is put on the events queue, which
+    the GUI drains from root.after callbacks (Tk must only be touched from the
+    main thread):
+        ("progress", text)  - status line, e.g. nodes expanded so far
+        ("steps", batch)    - expansion events of a step-streaming solver
+        ("done", result)    - work returned result
+        ("cancelled", None) - work stopped after cancel()
+        ("error", exception)
+    Cancellation is cooperative: work calls job.check(), which raises
+    JobCancelled after cancel(). Solves get that for free by running on a
+    ProgressGrid.
+    """
+
+    def __init__(self, work, *args):
+        self.events = queue.Queue()
+        self.cancelled = threading.Event()
+        self.thread = threading.Thread(target=self._run, args=(work, args), daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def _run(self, work, args):
+        try:
+            result = work(self, *args)
+        except JobCancelled:
+            self.events.put(("cancelled", None))
+        except Exception as e:  # Handed to the GUI thread to report
+            self.events.put(("error", e))
+        else:
+            self.events.put(("done", result))
+
+    def cancel(self):
+        self.cancelled.set()
+
+    def check(self):
+        """Raises JobCancelled if the job has been cancelled."""
+        if self.cancelled.is_set():
+            raise JobCancelled()
+
+    def send(self, kind, value):
+        self.events.put((kind, value))
+
+    def report(self, text):
+        self.send("progress", text)
+
+class ProgressGrid(Grid):
+    """
+    A Grid sharing another grid's cells (and costs) whose neighbors() counts calls (one
+    per expanded cell in every solver that expands through it), reports the
+    count to a BackgroundJob every PROGRESS_INTERVAL seconds and stops the
+    solve by raising JobCancelled once the job is cancelled.
+    Solvers that do not expand through neighbors() (JPS, the NumPy wavefront)
+    run unchanged; a cancelled job's result is simply ignored.
+    """
+
+    __slots__ = ("job", "label", "expanded", "next_report")
+
+    def __init__(self, maze, job, label="Solving"):
+        grid = as_grid(maze)
+        super().__init__(grid.rows, grid.cols, grid.cells, grid.costs)
+        self._cost_range = grid._cost_range  # Shared costs, so no need to scan them again
+        self.version, self._derived = grid.version, grid._derived  # Shared cells, so share what is built from them
+        self.job = job
+        self.label = label
+        self.expanded = 0
+        self.next_report = time.perf_counter() + PROGRESS_INTERVAL
+
+    def neighbors(self, index):
+        self.expanded += 1
+        if not self.expanded & 1023:  # Check the clock only every 1024 expansions
+            self.job.check()
+            now = time.perf_counter()
+            if now >= self.next_report:
+                self.next_report = now + PROGRESS_INTERVAL
+                self.job.report(f"{self.label}: {self.expanded:,} nodes expanded so far")
+        return Grid.neighbors(self, index)
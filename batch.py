@@ -0,0 +1,318 @@
+import argparse
+import csv
+import json
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import resource_tracker, shared_memory
+from grid import Grid
+from maze import create_maze
+from maze_graph import pruned_grid
+from maze_io import load_maze, read_maze
+from search_algorithms import ALGORITHMS, SolverWorkspace, a_star, bfs, dfs, path_cost
+from solve_cache import default_cache
+
+RESULT_FIELDS = ["index", "maze", "rows", "cols", "algorithm",
+                 "solved", "path_length", "nodes_expanded", "time_ms", "path_cost", "cached"]
+
+# Scratch arrays reused by every bfs/dfs/a_star solve in this (worker) process
+_workspace = SolverWorkspace()
+
+def iter_sources(inputs, stdin=sys.stdin):
+    """
+    Expands the command-line inputs into maze sources: maze files, directories
+    of maze files, .jsonl files of generation specs, or "-" to read specs and
+    file paths from stdin, one per line. A generation spec looks like
+        {"generator": "kruskal", "rows": 201, "cols": 201, "seed": 7}
+    Extra keys (e.g. "difficulty") are passed to maze.create_maze; optional
+    "start" and "end" override the default corners.
+    Yields ("file", path) or ("spec", dict) tuples in input order.
+    """
+    for item in inputs:
+        if item == "-":
+            yield from _iter_lines(stdin, "<stdin>")
+        elif os.path.isdir(item):
+            for name in sorted(os.listdir(item)):
+                path = os.path.join(item, name)
+                if os.path.isfile(path):
+                    yield from iter_sources([path], stdin)
+        elif item.endswith(".jsonl"):
+            with open(item, encoding="utf-8") as f:
+                yield from _iter_lines(f, item)
+        else:
+            yield "file", item
+
+def _iter_lines(lines, origin):
+    """Parses a stream of generation specs (JSON objects) and file paths."""
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("{"):
+            try:
+                yield "spec", json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{origin}:{number}: invalid spec: {e}") from None
+        else:
+            yield "file", line
+
+def _attach_shared(name):
+    """Attaches to an existing segment without registering it for cleanup here."""
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13 has no track argument
+        return shared_memory.SharedMemory(name=name)
+
+def _solve_all(grid, start, end, algorithms, prune=False):
+    """
+    Runs each algorithm on grid (with prune, on its dead-end pruned copy) and
+    returns partial result records. Results for mazes this worker (or, with a
+    cache directory, any worker) has seen before come from the solve cache,
+    with cached set and time_ms as measured by the original solve.
+    """
+    solved = pruned_grid(grid, start, end) if prune else grid
+    records = []
+    for name in algorithms:
+        result = default_cache.lookup(solved, start, end, name)
+        cached = result is not None
+        if not cached:
+            solver = ALGORITHMS[name]
+            if solver in (bfs, dfs, a_star):
+                result = solver(solved, start, end, workspace=_workspace)
+            else:
+                result = solver(solved, start, end)
+            default_cache.store(solved, start, end, name, result)
+        path, nodes, time_taken = result
+        records.append({
+            "algorithm": name,
+            "solved": path is not None,
+            "path_length": len(path) if path else None,
+            "nodes_expanded": nodes,
+            "time_ms": round(time_taken * 1000, 3),
+            "path_cost": path_cost(grid, path) if path else None,
+            "cached": cached,
+        })
+    return records
+
+def solve_task(task):
+    """
+    Worker entry point. task is a dict with the maze location (a shared memory
+    segment name, a memory-mappable .maze path or a generation spec), its label,
+    the algorithm names and whether to prune dead ends first.
+    Returns the finished result records for this maze.
+    """
+    start, end = task.get("start"), task.get("end")
+    if "shm" in task:
+        rows, cols = task["rows"], task["cols"]
+        shm = _attach_shared(task["shm"])
+        view = shm.buf[:rows * cols]
+        try:
+            grid = Grid(rows, cols, view)
+            records = _solve_all(grid, tuple(start or (0, 0)),
+                                 tuple(end or (rows - 1, cols - 1)), task["algorithms"], task["prune"])
+            del grid
+        finally:
+            view.release()
+            shm.close()
+    elif "path" in task:
+        grid, _ = load_maze(task["path"])
+        rows, cols = grid.rows, grid.cols
+        records = _solve_all(grid, tuple(start or (0, 0)),
+                             tuple(end or (rows - 1, cols - 1)), task["algorithms"], task["prune"])
+    else:
+        spec = dict(task["spec"])
+        spec.pop("start", None)
+        spec.pop("end", None)
+        grid = create_maze(spec.pop("generator", "random"), spec.pop("rows"), spec.pop("cols"),
+                           seed=spec.pop("seed", None), **spec)
+        rows, cols = grid.rows, grid.cols
+        records = _solve_all(grid, tuple(start or (0, 0)),
+                             tuple(end or (rows - 1, cols - 1)), task["algorithms"], task["prune"])
+
+    for record in records:
+        record.update(index=task["index"], maze=task["label"], rows=rows, cols=cols)
+    return [{field: record[field] for field in RESULT_FIELDS} for record in records]
+
+def _make_task(index, source, algorithms, prune=False):
+    """
+    Builds a picklable task for one source. Unpacked and weighted binary
+    mazes are loaded by the worker itself (memory-mapped when unpacked); other file mazes are loaded here and
+    copied into a new shared memory segment, which is returned for cleanup.
+    """
+    kind, value = source
+    task = {"index": index, "algorithms": algorithms, "label": source_label(source), "prune": prune}
+    if kind == "spec":
+        task.update(spec=value, start=value.get("start"), end=value.get("end"))
+        return task, None
+    grid, header = read_maze(value)
+    if header is not None:
+        task.update(start=header.start, end=header.end)
+        if not header.packed or header.weighted:
+            task.update(path=value)
+            return task, None
+    shm = shared_memory.SharedMemory(create=True, size=grid.size)
+    shm.buf[:grid.size] = grid.cells
+    task.update(shm=shm.name, rows=grid.rows, cols=grid.cols)
+    return task, shm
+
+def source_label(source):
+    """The maze column of a source's records: its file path or its spec as JSON."""
+    kind, value = source
+    return json.dumps(value, sort_keys=True) if kind == "spec" else value
+
+def report_error(label, error):
+    """Default run_batch error handler: one line on stderr per failed source."""
+    print(f"{label}: {type(error).__name__}: {error}", file=sys.stderr)
+
+def _init_worker(cache_dir):
+    default_cache.directory = cache_dir
+
+def run_batch(sources, algorithms, writer, workers=None, cache_dir=None, on_error=report_error,
+              prune=False):
+    """
+    Solves every source with every algorithm across a process pool and passes
+    each finished record to writer. Grids are never pickled: unpacked .maze
+    files are memory-mapped by the workers, other file mazes are copied once
+    into shared memory that workers attach to, and spec mazes are generated
+    inside the worker. At most two tasks per worker are in flight,
+    so only that many shared memory segments exist at any time.
+    Each worker keeps a solve cache in memory; with cache_dir its results are
+    also shared through that directory. With prune, every maze has its dead
+    ends filled in (keeping start and end) before it is solved.
+    A source that cannot be loaded or solved is passed to on_error(label,
+    exception) and the batch carries on with the others. If reading the
+    sources themselves fails, the solves already in flight are still written
+    before the error is raised.
+    Returns the number of records written.
+    """
+    workers = workers or os.cpu_count() or 1
+    sources = iter(sources)
+    written = 0
+    pending = {}  # future -> (shared memory segment or None, label)
+
+    def release(shm):
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+    if os.name == "posix":
+        # Start the resource tracker before any worker is forked, so workers
+        # share it instead of starting their own, which would unlink segments
+        # they attached to when they exit
+        resource_tracker.ensure_running()
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(cache_dir,)) as pool:
+        try:
+            try:
+                for index, source in enumerate(sources):
+                    try:
+                        task, shm = _make_task(index, source, algorithms, prune)
+                    except (OSError, ValueError) as e:
+                        on_error(source_label(source), e)
+                        continue
+                    try:
+                        pending[pool.submit(solve_task, task)] = (shm, task["label"])
+                    except BaseException:
+                        release(shm)
+                        raise
+                    while len(pending) >= 2 * workers:
+                        written += _drain(pending, writer, release, on_error)
+            except Exception:
+                while pending:  # Keep the results already being computed
+                    written += _drain(pending, writer, release, on_error)
+                raise
+            while pending:
+                written += _drain(pending, writer, release, on_error)
+        finally:
+            for future in pending:
+                future.cancel()
+            wait(pending)
+            for shm, _ in pending.values():
+                release(shm)
+    return written
+
+def _drain(pending, writer, release, on_error):
+    """Waits for in-flight tasks, writes their records and frees their segments."""
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    written = 0
+    for future in done:
+        shm, label = pending.pop(future)
+        release(shm)
+        try:
+            records = future.result()
+        except Exception as e:
+            on_error(label, e)
+            continue
+        for record in records:
+            writer(record)
+            written += 1
+    return written
+
+def make_writer(stream, fmt):
+    """Returns a function that writes one result record to stream as jsonl or csv."""
+    if fmt == "csv":
+        csv_writer = csv.DictWriter(stream, fieldnames=RESULT_FIELDS)
+        csv_writer.writeheader()
+        return csv_writer.writerow
+    if fmt == "jsonl":
+        return lambda record: stream.write(json.dumps(record) + "\n")
+    raise ValueError(f"Unknown output format: {fmt}")
+
+def resolve_algorithms(names):
+    """Maps algorithm names (case-insensitive) onto ALGORITHMS keys."""
+    lookup = {name.lower(): name for name in ALGORITHMS}
+    resolved = []
+    for name in names:
+        if name.lower() not in lookup:
+            raise ValueError(f"Unknown algorithm {name!r}; choose from {', '.join(ALGORITHMS)}")
+        resolved.append(lookup[name.lower()])
+    return resolved
+
+def main(argv=None):
+    """
+    Command-line entry point for headless batch solving. Exits with status 1
+    if any source failed; the records of the others are still written.
+    """
+    parser = argparse.ArgumentParser(
+        description="Solve mazes in parallel without the GUI and write one record "
+                    "per (maze, algorithm) as JSON Lines or CSV.")
+    parser.add_argument("inputs", nargs="+",
+                        help="maze files, directories, .jsonl spec files, or - for stdin")
+    parser.add_argument("-a", "--algorithms", nargs="+", default=["BFS", "DFS", "A*"],
+                        help=f"algorithms to run (available: {', '.join(ALGORITHMS)})")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument("-f", "--format", choices=["jsonl", "csv"], default="jsonl")
+    parser.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    parser.add_argument("--cache-dir", default=None,
+                        help="directory for solve results shared by all workers and later runs")
+    parser.add_argument("--prune-dead-ends", action="store_true",
+                        help="fill in dead ends (keeping start and end) before solving")
+    args = parser.parse_args(argv)
+
+    try:
+        algorithms = resolve_algorithms(args.algorithms)
+    except ValueError as e:
+        parser.error(str(e))
+
+    failures = []
+
+    def on_error(label, error):
+        failures.append(label)
+        report_error(label, error)
+
+    stream = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+    try:
+        run_batch(iter_sources(args.inputs), algorithms, make_writer(stream, args.format), args.workers,
+                  args.cache_dir, on_error, args.prune_dead_ends)
+    except (OSError, ValueError) as e:
+        report_error("batch", e)
+        return 1
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
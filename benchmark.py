@@ -0,0 +1,412 @@
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+from collections import deque
+from maze import create_maze, generate_maze
+from search_algorithms import ALGORITHMS, bfs, dfs, a_star, bidirectional_a_star, HEURISTICS, SolverWorkspace
+
+# Default sweep: every solver on each (generator, difficulty) variant at each
+# size, for each seed. Difficulty only applies to the random generator.
+SWEEP_SIZES = (50, 100)
+SWEEP_VARIANTS = (('random', 'easy'), ('random', 'medium'), ('random', 'hard'),
+                  ('kruskal', None), ('backtracker', None))
+SWEEP_SEEDS = (0, 1)
+BASELINE_FILE = "benchmark_baseline.json"
+
+
+def bfs_path_copy(maze, start, end):
+    """
+    Reference BFS that carries a full path list with every queue entry.
+    This is how the solvers used to work and is kept only as the "before"
+    baseline for the memory/throughput benchmark.
+    Returns: (path, nodes_expanded, time_taken)
+    """
+    rows, cols = len(maze), len(maze[0])
+    queue = deque([(start, [start])])
+    visited = set()
+    visited.add(start)
+    nodes_expanded = 0
+    start_time = time.perf_counter()
+
+    while queue:
+        (x, y), path = queue.popleft()
+        nodes_expanded += 1
+        if (x, y) == end:
+            return path, nodes_expanded, time.perf_counter() - start_time
+
+        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < rows and 0 <= ny < cols and maze[nx][ny] == 0 and (nx, ny) not in visited:
+                queue.append(((nx, ny), path + [(nx, ny)]))
+                visited.add((nx, ny))
+
+    return None, nodes_expanded, time.perf_counter() - start_time
+
+
+def measure(solver, maze, start, end):
+    """
+    Runs one untraced solve for timing and a second one under tracemalloc
+    for peak memory, since tracing slows allocation-heavy code unevenly.
+    Returns: (path_length, nodes_expanded, time_taken, peak_bytes)
+    """
+    path, nodes, time_taken = solver(maze, start, end)
+    tracemalloc.start()
+    try:
+        solver(maze, start, end)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (len(path) if path else 0), nodes, time_taken, peak
+
+
+def run_memory_benchmark(sizes=(100, 200, 400), difficulty='easy'):
+    """
+    Compares the path-copying BFS against the parent-array solvers and
+    prints peak memory and throughput (nodes expanded per second).
+    """
+    solvers = [
+        ("BFS (path copy)", bfs_path_copy),
+        ("BFS", bfs),
+        ("DFS", dfs),
+        ("A*", a_star),
+    ]
+    print(f"{'Size':<10}{'Algorithm':<18}{'Path':<8}{'Nodes':<10}{'Time (ms)':<12}{'Peak (KB)':<12}{'Nodes/s':<12}")
+    print("-" * 82)
+    for size in sizes:
+        maze = generate_maze(size, size, difficulty)
+        start, end = (0, 0), (size - 1, size - 1)
+        for name, solver in solvers:
+            # The path-copying baseline runs on the list-of-lists layout it was written for
+            solver_maze = maze.to_rows() if solver is bfs_path_copy else maze
+            length, nodes, time_taken, peak = measure(solver, solver_maze, start, end)
+            rate = nodes / time_taken if time_taken > 0 else 0
+            print(f"{f'{size}x{size}':<10}{name:<18}{length:<8}{nodes:<10}"
+                  f"{time_taken*1000:<12.2f}{peak/1024:<12.1f}{rate:<12.0f}")
+
+
+def check_a_star_regression(sizes=(50, 100, 200), seeds=range(5), perfect_sizes=(101, 201),
+                            perfect_generators=('wilson', 'kruskal', 'eller', 'backtracker')):
+    """
+    Regression check for a_star on the benchmark mazes: every heuristic must
+    return a path as short as bfs, and the Manhattan heuristic must expand
+    fewer nodes than bfs. On perfect mazes bidirectional_a_star must return a
+    path as short as a_star and, summed over the seeds, expand no more than
+    10% more nodes (it should expand fewer on all but the long winding
+    corridors of backtracker mazes). Raises AssertionError on the first violation.
+    """
+    for size in sizes:
+        for difficulty in ('easy', 'medium', 'hard'):
+            for seed in seeds:
+                maze = generate_maze(size, size, difficulty, seed=seed)
+                start, end = (0, 0), (size - 1, size - 1)
+                bfs_path, bfs_nodes, _ = bfs(maze, start, end)
+                for name in HEURISTICS:
+                    path, nodes, _ = a_star(maze, start, end, name)
+                    case = f"{size}x{size} {difficulty} seed={seed} heuristic={name}"
+                    assert len(path) == len(bfs_path), f"{case}: path {len(path)} != bfs {len(bfs_path)}"
+                    if name == "manhattan":
+                        assert nodes < bfs_nodes, f"{case}: expanded {nodes} >= bfs {bfs_nodes}"
+    for size in perfect_sizes:
+        for generator in perfect_generators:
+            a_star_total = bidirectional_total = 0
+            for seed in seeds:
+                maze = create_maze(generator, size, size, seed=seed)
+                start, end = (0, 0), (size - 1, size - 1)
+                a_star_path, a_star_nodes, _ = a_star(maze, start, end)
+                path, nodes, _ = bidirectional_a_star(maze, start, end)
+                case = f"{size}x{size} {generator} seed={seed}"
+                assert len(path) == len(a_star_path), f"{case}: Bi-A* path {len(path)} != A* {len(a_star_path)}"
+                a_star_total += a_star_nodes
+                bidirectional_total += nodes
+            assert bidirectional_total <= 1.1 * a_star_total, \
+                f"{size}x{size} {generator}: Bi-A* expanded {bidirectional_total} > 1.1 x A* {a_star_total}"
+    print("A* regression check passed")
+
+
+def run_workspace_benchmark(sizes=(15, 100, 400), difficulty='medium', solves=2000, radius=4,
+                            repeats=3, seed=1, solvers=(("BFS", bfs), ("A*", a_star))):
+    """
+    Microbenchmark for many small solves: solves per second of bfs, dfs and
+    a_star with fresh arrays on every call versus one shared SolverWorkspace.
+    Each query ends a random walk of radius steps away from its start, so the
+    search itself is short and the per-call setup is what differs; on large
+    grids that setup (allocating size-long arrays) dominates. Best of repeats.
+    dfs accepts a workspace too but is left out by default: it wanders deep
+    before finding even a nearby goal, so its time is all search.
+    """
+    import random
+    print(f"{'Size':<10}{'Algorithm':<12}{'Fresh (solves/s)':<20}{'Workspace (solves/s)':<24}{'Speedup':<8}")
+    print("-" * 74)
+    for size in sizes:
+        maze = generate_maze(size, size, difficulty, seed=seed)
+        open_cells = [maze.coords(i) for i in range(maze.size) if maze.cells[i] == 0]
+        rng = random.Random(seed)
+        queries = []
+        for _ in range(solves):
+            start = rng.choice(open_cells)
+            index = maze.index(*start)
+            for _ in range(radius):  # Random walk, so end is reachable within radius steps
+                index = rng.choice(maze.neighbors(index) or [index])
+            queries.append((start, maze.coords(index)))
+        workspace = SolverWorkspace(maze.size)
+
+        for name, solver in solvers:
+            best = [float("inf"), float("inf")]
+            for _ in range(repeats):
+                for i, kwargs in enumerate(({}, {"workspace": workspace})):
+                    start_time = time.perf_counter()
+                    for start, end in queries:
+                        solver(maze, start, end, **kwargs)
+                    best[i] = min(best[i], time.perf_counter() - start_time)
+            fresh, reused = solves / best[0], solves / best[1]
+            print(f"{f'{size}x{size}':<10}{name:<12}{fresh:<20.0f}{reused:<24.0f}{reused / fresh:<8.2f}")
+
+
+def percentile(values, q):
+    """q-th percentile (0-100) of values, interpolating between closest ranks."""
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    low = int(position)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+
+def summarize(values):
+    """Median and 10th/90th percentiles of a list of measurements."""
+    return {"median": percentile(values, 50), "p10": percentile(values, 10), "p90": percentile(values, 90)}
+
+
+def run_sweep(sizes=SWEEP_SIZES, variants=SWEEP_VARIANTS, seeds=SWEEP_SEEDS,
+              algorithms=None, trials=5, warmup=1):
+    """
+    Solves each generated maze (corner to corner) with every algorithm:
+    warmup untimed runs, then trials measured runs (see measure), each right
+    after one run of the reference workload (see reference_time).
+    algorithms is a list of ALGORITHMS names (default: all of them).
+    Returns one record per (maze, algorithm) with the median and 10th/90th
+    percentiles of time_ms, nodes and peak_kb over the trials, and the median
+    reference time as reference_ms.
+    """
+    algorithms = list(algorithms or ALGORITHMS)
+    reference = reference_maze()
+    records = []
+    for generator, difficulty in variants:
+        options = {'difficulty': difficulty} if difficulty else {}
+        for size in sizes:
+            for seed in seeds:
+                maze = create_maze(generator, size, size, seed=seed, **options)
+                start, end = (0, 0), (size - 1, size - 1)
+                for name in algorithms:
+                    solver = ALGORITHMS[name]
+                    for _ in range(warmup):
+                        solver(maze, start, end)
+                    samples, references = [], []
+                    for _ in range(trials):
+                        references.append(reference_time(reference))
+                        samples.append(measure(solver, maze, start, end))
+                    records.append({
+                        "generator": generator,
+                        "difficulty": difficulty,
+                        "size": size,
+                        "seed": seed,
+                        "algorithm": name,
+                        "path_length": samples[0][0],
+                        "time_ms": summarize([sample[2] * 1000 for sample in samples]),
+                        "nodes": summarize([sample[1] for sample in samples]),
+                        "peak_kb": summarize([sample[3] / 1024 for sample in samples]),
+                        "reference_ms": percentile(references, 50),
+                    })
+    return records
+
+
+def case_key(record):
+    """Identifies a sweep record across runs: generator/difficulty/size/seed/algorithm."""
+    return "/".join(str(record[field]) for field in ("generator", "difficulty", "size", "seed", "algorithm"))
+
+
+def print_scaling(records):
+    """
+    Prints the scaling curves of a sweep: for each algorithm and maze variant,
+    the median solve time (ms) at every size, taking the median over seeds.
+    """
+    sizes = sorted({record["size"] for record in records})
+    curves = {}
+    for record in records:
+        variant = record["generator"] + (f" ({record['difficulty']})" if record["difficulty"] else "")
+        curve = curves.setdefault((record["algorithm"], variant), {})
+        curve.setdefault(record["size"], []).append(record["time_ms"]["median"])
+
+    print(f"{'Algorithm':<14}{'Maze':<20}" + "".join(f"{f'{size}x{size}':>12}" for size in sizes))
+    print("-" * (34 + 12 * len(sizes)))
+    for (name, variant), curve in curves.items():
+        cells = "".join(f"{percentile(curve[size], 50):>12.2f}" if size in curve else f"{'-':>12}"
+                        for size in sizes)
+        print(f"{name:<14}{variant:<20}{cells}")
+
+
+def reference_time(maze):
+    """
+    Time (ms) of one run of a fixed reference workload: bfs_path_copy, which
+    lives here and never changes, corner to corner on the reference maze
+    (reference_maze()). Solve times are compared relative to it, so a
+    baseline stored on another machine (or on this one under a different
+    load) can still be compared.
+    """
+    return bfs_path_copy(maze, (0, 0), (99, 99))[2] * 1000
+
+
+def reference_maze():
+    return generate_maze(100, 100, 'easy', seed=0).to_rows()
+
+
+def calibrate(trials=25):
+    """Median reference_time (ms) over trials runs."""
+    maze = reference_maze()
+    return percentile([reference_time(maze) for _ in range(trials)], 50)
+
+
+def save_results(path, records, trials, warmup, calibration_ms):
+    """Writes sweep records and the machine they were measured on as JSON."""
+    document = {
+        "meta": {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "trials": trials,
+            "warmup": warmup,
+            "calibration_ms": calibration_ms,
+        },
+        "results": records,
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=1)
+        f.write("\n")
+
+
+def load_results(path):
+    """Reads a file written by save_results. Returns (records, calibration_ms)."""
+    with open(path, encoding="utf-8") as f:
+        document = json.load(f)
+    return document["results"], document["meta"].get("calibration_ms")
+
+
+def compare_to_baseline(records, baseline, time_tolerance=0.25, memory_tolerance=0.10, time_scale=1.0):
+    """
+    Compares sweep records with baseline records of the same cases.
+    Path lengths and node counts are deterministic for fixed seeds, so any
+    change in path length and any increase in nodes is reported per case, as
+    is median peak memory growing by more than memory_tolerance (a fraction).
+    Single timings are too noisy to gate one by one, so time is gated per
+    algorithm: the geometric mean of new/baseline median-time ratios over all
+    its cases may grow by at most time_tolerance. Each baseline time is first
+    scaled by the ratio of the reference times measured alongside that case
+    in both runs, which follows the machine's speed from moment to moment;
+    baseline records without reference_ms are scaled by time_scale (current /
+    baseline calibration) instead.
+    A case with no baseline record (e.g. a newly added algorithm) is reported
+    too, so nothing goes ungated; baseline cases left out of this run (a
+    narrower sweep) are skipped.
+    Returns a list of regression messages (empty when nothing regressed).
+    """
+    base = {case_key(record): record for record in baseline}
+    regressions = []
+    log_ratios = {}  # algorithm -> [log(new time / baseline time), ...]
+    for record in records:
+        key = case_key(record)
+        old = base.get(key)
+        if old is None:
+            regressions.append(f"{key}: not in baseline (refresh it with --save-baseline)")
+            continue
+        if record["path_length"] != old["path_length"]:
+            regressions.append(f"{key}: path length {old['path_length']} -> {record['path_length']}")
+        if record["nodes"]["median"] > old["nodes"]["median"]:
+            regressions.append(f"{key}: nodes expanded {old['nodes']['median']:g} -> {record['nodes']['median']:g}")
+        old_peak, new_peak = old["peak_kb"]["median"], record["peak_kb"]["median"]
+        if new_peak > old_peak * (1 + memory_tolerance):
+            regressions.append(f"{key}: peak memory {old_peak:.1f} KB -> {new_peak:.1f} KB")
+        scale = time_scale
+        if "reference_ms" in old and "reference_ms" in record:
+            scale = record["reference_ms"] / old["reference_ms"]
+        old_time, new_time = old["time_ms"]["median"] * scale, record["time_ms"]["median"]
+        if old_time > 0 and new_time > 0:
+            log_ratios.setdefault(record["algorithm"], []).append(math.log(new_time / old_time))
+
+    for name, logs in log_ratios.items():
+        ratio = math.exp(sum(logs) / len(logs))
+        if ratio > 1 + time_tolerance:
+            regressions.append(f"{name}: median time x{ratio:.2f} of baseline (geometric mean of {len(logs)} cases)")
+    return regressions
+
+
+def main(argv=None):
+    """
+    Without --sweep, runs the quick checks and benchmarks of the example usage.
+    With --sweep, runs the benchmark sweep, prints scaling curves, optionally
+    writes the results and gates them against a stored baseline (exit code 1
+    on regression).
+    """
+    parser = argparse.ArgumentParser(description="Maze solver benchmarks.")
+    parser.add_argument("--sweep", action="store_true",
+                        help="run the size/density/generator sweep instead of the quick benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SWEEP_SIZES))
+    parser.add_argument("--seeds", type=int, nargs="+", default=list(SWEEP_SEEDS))
+    parser.add_argument("--variants", nargs="+", default=None,
+                        help="generator or random:difficulty entries (default: random at every "
+                             "difficulty, kruskal, backtracker)")
+    parser.add_argument("-a", "--algorithms", nargs="+", default=None,
+                        help=f"algorithms to run (default: all of {', '.join(ALGORITHMS)})")
+    parser.add_argument("--trials", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("-o", "--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", nargs="?", const=BASELINE_FILE,
+                        help=f"compare with a stored baseline (default file: {BASELINE_FILE})")
+    parser.add_argument("--save-baseline", nargs="?", const=BASELINE_FILE,
+                        help="store the results as the new baseline")
+    parser.add_argument("--time-tolerance", type=float, default=0.25,
+                        help="allowed fractional growth of median time (default: 0.25)")
+    args = parser.parse_args(argv)
+
+    if not args.sweep:
+        check_a_star_regression()
+        run_memory_benchmark()
+        run_workspace_benchmark()
+        return 0
+
+    variants = SWEEP_VARIANTS
+    if args.variants:
+        variants = [tuple(entry.split(":", 1)) if ":" in entry else (entry, None) for entry in args.variants]
+    lookup = {name.lower(): name for name in ALGORITHMS}
+    algorithms = None
+    if args.algorithms:
+        unknown = [name for name in args.algorithms if name.lower() not in lookup]
+        if unknown:
+            parser.error(f"Unknown algorithm {unknown[0]!r}; choose from {', '.join(ALGORITHMS)}")
+        algorithms = [lookup[name.lower()] for name in args.algorithms]
+
+    records = run_sweep(args.sizes, variants, args.seeds, algorithms, args.trials, args.warmup)
+    calibration_ms = percentile([record["reference_ms"] for record in records], 50)
+    print_scaling(records)
+    for path in (args.output, args.save_baseline):
+        if path:
+            save_results(path, records, args.trials, args.warmup, calibration_ms)
+            print(f"Results written to {path}")
+    if args.baseline:
+        baseline, baseline_calibration = load_results(args.baseline)
+        time_scale = calibration_ms / baseline_calibration if baseline_calibration else 1.0
+        print(f"Calibration {calibration_ms:.2f} ms (baseline {baseline_calibration or 0:.2f} ms)")
+        regressions = compare_to_baseline(records, baseline, args.time_tolerance, time_scale=time_scale)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        print(f"{len(regressions)} regression(s) against {args.baseline}")
+        return 1 if regressions else 0
+    return 0
+
+
+# Example Usage
+if __name__ == "__main__":
+    sys.exit(main())
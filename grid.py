@@ -0,0 +1,232 @@
+import hashlib
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; Grid works on a plain bytearray
+    np = None
+
+OPEN = 0
+WALL = 1
+SCAN_CHUNK = 1 << 20  # Bytes of a memoryview-backed payload copied at a time when scanning it
+
+
+class Grid:
+    """
+    Compact maze grid backed by one contiguous bytearray (one uint8 per cell).
+    0 -> Open path
+    1 -> Wall
+    Cells are addressed either as (row, col) or by flat index row * cols + col.
+    grid[row][col] still works (rows are memoryview slices that write through),
+    so code written against list-of-lists mazes keeps working.
+    version is bumped by every edit made through toggle(), so caches built
+    from a grid (such as a MazeIndex) can tell when they are out of date, and
+    digest() is only recomputed after such an edit.
+    Weighted (terrain) grids also have costs: one uint8 per cell giving the
+    cost (1-255) of stepping onto it. costs is None for plain mazes, where
+    every step costs 1; only dijkstra and a_star take costs into account.
+    The cheapest and dearest step cost are found once and remembered.
+    """
+
+    __slots__ = ("rows", "cols", "cells", "version", "costs", "_digest", "_cells_digest", "_cost_range",
+                 "_derived")
+
+    def __init__(self, rows, cols, cells=None, costs=None):
+        if rows <= 0 or cols <= 0:
+            raise ValueError("Grid dimensions must be positive")
+        self.rows = rows
+        self.cols = cols
+        if cells is None:
+            cells = bytearray(rows * cols)
+        elif len(cells) != rows * cols:
+            raise ValueError(f"Expected {rows * cols} cells, got {len(cells)}")
+        if costs is not None:
+            if len(costs) != rows * cols:
+                raise ValueError(f"Expected {rows * cols} costs, got {len(costs)}")
+            if any(chunk.find(0) != -1 for chunk in _chunks(costs)):
+                raise ValueError("Step costs must be between 1 and 255")
+        self.cells = cells
+        self.costs = costs
+        self.version = 0
+        self._digest = None  # (version, digest) of the last digest() call
+        self._cells_digest = None  # (version, digest) of the last cells_digest() call
+        self._cost_range = None  # (min, max) step cost, once asked for
+        self._derived = {}  # key -> (version, value) of derived() calls
+
+    @classmethod
+    def from_rows(cls, maze):
+        """Builds a Grid from a list-of-lists maze."""
+        rows, cols = len(maze), len(maze[0])
+        cells = bytearray(rows * cols)
+        for r, row in enumerate(maze):
+            if len(row) != cols:
+                raise ValueError("All maze rows must have the same length")
+            cells[r * cols:(r + 1) * cols] = bytes(row)
+        return cls(rows, cols, cells)
+
+    def to_rows(self):
+        """Returns the maze as a list of lists of ints."""
+        cols = self.cols
+        return [list(self.cells[r * cols:(r + 1) * cols]) for r in range(self.rows)]
+
+    def as_numpy(self):
+        """Returns a (rows, cols) uint8 NumPy view sharing this grid's buffer."""
+        if np is None:
+            raise ImportError("NumPy is required for Grid.as_numpy()")
+        return np.frombuffer(self.cells, dtype=np.uint8).reshape(self.rows, self.cols)
+
+    def copy(self):
+        return Grid(self.rows, self.cols, bytearray(self.cells),
+                    None if self.costs is None else bytearray(self.costs))
+
+    @property
+    def weighted(self):
+        return self.costs is not None
+
+    def min_cost(self):
+        """Cheapest step cost anywhere on the grid (1 for unweighted grids)."""
+        return 1 if self.costs is None else self._costs_range()[0]
+
+    def max_cost(self):
+        """Dearest step cost anywhere on the grid (1 for unweighted grids)."""
+        return 1 if self.costs is None else self._costs_range()[1]
+
+    def _costs_range(self):
+        if self._cost_range is None:
+            ranges = [(min(chunk), max(chunk)) for chunk in _chunks(self.costs)]
+            self._cost_range = (min(low for low, _ in ranges), max(high for _, high in ranges))
+        return self._cost_range
+
+    def digest(self):
+        """
+        Returns a 16-byte BLAKE2b digest of the dimensions, cells and costs,
+        for caches keyed by maze content. It is remembered until the next
+        toggle(); cells written directly are not noticed until then.
+        Without costs it equals cells_digest().
+        """
+        if self.costs is None:
+            return self.cells_digest()
+        if self._digest is None or self._digest[0] != self.version:
+            h = self._hash_cells()
+            h.update(self.costs)
+            self._digest = (self.version, h.digest())
+        return self._digest[1]
+
+    def cells_digest(self):
+        """
+        Returns a 16-byte BLAKE2b digest of the dimensions and cells only, for
+        files that record which wall layout they were built from (e.g. maze
+        indexes). Remembered like digest().
+        """
+        if self._cells_digest is None or self._cells_digest[0] != self.version:
+            self._cells_digest = (self.version, self._hash_cells().digest())
+        return self._cells_digest[1]
+
+    def derived(self, key, build):
+        """
+        Returns build(self), remembered under key until the next toggle(), for
+        structures solvers precompute from the cells (e.g. corridor graphs).
+        """
+        entry = self._derived.get(key)
+        if entry is None or entry[0] != self.version:
+            entry = (self.version, build(self))
+            self._derived[key] = entry
+        return entry[1]
+
+    def _hash_cells(self):
+        return hashlib.blake2b(self.cells, digest_size=16, person=b"%dx%d" % (self.rows, self.cols))
+
+    @property
+    def size(self):
+        return self.rows * self.cols
+
+    @property
+    def nbytes(self):
+        return len(self.cells)
+
+    def index(self, row, col):
+        return row * self.cols + col
+
+    def coords(self, index):
+        return divmod(index, self.cols)
+
+    def in_bounds(self, row, col):
+        return 0 <= row < self.rows and 0 <= col < self.cols
+
+    def is_open(self, index):
+        return self.cells[index] == OPEN
+
+    def toggle(self, row, col):
+        """Flips a cell between wall and open path."""
+        index = row * self.cols + col
+        self.cells[index] ^= 1
+        self.version += 1
+
+    def neighbors(self, index):
+        """
+        Returns the flat indices of the open cells next to index,
+        in Up, Down, Left, Right order.
+        """
+        cells, cols = self.cells, self.cols
+        row, col = divmod(index, cols)
+        result = []
+        if row > 0 and cells[index - cols] == OPEN:
+            result.append(index - cols)
+        if row < self.rows - 1 and cells[index + cols] == OPEN:
+            result.append(index + cols)
+        if col > 0 and cells[index - 1] == OPEN:
+            result.append(index - 1)
+        if col < cols - 1 and cells[index + 1] == OPEN:
+            result.append(index + 1)
+        return result
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, row):
+        if row < 0:
+            row += self.rows
+        if not 0 <= row < self.rows:
+            raise IndexError("Grid row index out of range")
+        return memoryview(self.cells)[row * self.cols:(row + 1) * self.cols]
+
+    def __iter__(self):
+        view = memoryview(self.cells)
+        for r in range(self.rows):
+            yield view[r * self.cols:(r + 1) * self.cols]
+
+    def __eq__(self, other):
+        if isinstance(other, Grid):
+            return ((self.rows, self.cols) == (other.rows, other.cols) and self.cells == other.cells
+                    and self.costs == other.costs)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Grid(rows={self.rows}, cols={self.cols})"
+
+
+def _chunks(data):
+    """
+    Yields data in pieces that support bytes methods such as find: bytes and
+    bytearrays whole, memoryviews (e.g. memory-mapped files) SCAN_CHUNK bytes
+    at a time, so they are never copied into RAM in one piece.
+    """
+    if hasattr(data, "find"):
+        yield data
+        return
+    for offset in range(0, len(data), SCAN_CHUNK):
+        yield bytes(data[offset:offset + SCAN_CHUNK])
+
+
+def as_grid(maze):
+    """
+    Returns maze as a Grid. Grids are returned unchanged; list-of-lists mazes
+    and (rows, cols) NumPy arrays are copied into a new Grid.
+    """
+    if isinstance(maze, Grid):
+        return maze
+    if np is not None and isinstance(maze, np.ndarray):
+        rows, cols = maze.shape
+        return Grid(rows, cols, bytearray(maze.astype(np.uint8, copy=False).tobytes()))
+    return Grid.from_rows(maze)
@@ -1,8 +1,45 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 from maze import generate_maze
-from search_algorithms import bfs, dfs, a_star, compare_algorithms
-import time
+from maze_io import load_maze, is_binary_maze, read_text_maze, save_maze, write_text_maze
+from collections import deque
+from search_algorithms import ALGORITHMS, STEP_SOLVERS, IncrementalSolver, run_steps
+from background import BackgroundJob, ProgressGrid
+from maze_graph import pruned_grid
+from solve_cache import default_cache
+
+# Path colors used by the comparison view, in ALGORITHMS order
+PATH_COLORS = ["#4CAF50", "#FFC107", "#2196F3", "#9C27B0", "#FF5722", "#00BCD4", "#795548", "#E91E63", "#607D8B"]
+
+POLL_MS = 30  # How often the Tk thread checks a background job for events
+ANIMATION_MS = 10  # Delay between animation frames
+ANIMATION_STEP = 10  # Path cells drawn per animation frame (at least)
+ANIMATION_FRAMES = 200  # Longer paths draw more cells per frame to finish in about this many
+EXPLORE_STEP = 10  # Expansion events drawn per frame (at least)
+EXPLORE_CATCHUP = 20  # A backlog of events is worked off in about this many frames
+
+VIEW_SIZE = 600  # Largest canvas size in pixels; bigger mazes scroll
+MAX_CELL_SIZE = 30
+ITEM_MODE_LIMIT = 20000  # Mazes with more cells are drawn as an image instead of one item per cell
+WALL_COLORS = ("#333333", "#555555")  # (fill, outline)
+OPEN_COLORS = ("#f8f8f8", "#dddddd")
+EXPLORED_COLOR = "#FFE0B2"
+# Image mode pixel colors, indexed by wall | explored << 1, as one
+# bytes.translate table per RGB channel
+IMAGE_COLORS = (OPEN_COLORS[0], WALL_COLORS[0], EXPLORED_COLOR, WALL_COLORS[0])
+IMAGE_CHANNELS = [bytes.maketrans(bytes(range(len(IMAGE_COLORS))),
+                                  bytes(int(color[1 + 2 * k:3 + 2 * k], 16) for color in IMAGE_COLORS))
+                  for k in range(3)]
+
+def cache_result(job, maze, digest, start, end, algorithm, result, solved=None):
+    """
+    Stores a background solve in the solve cache, unless the job was
+    cancelled (the user may have edited the maze since) or the maze is no
+    longer the one that was solved (its digest changed). solved is the grid
+    the solver actually ran on, if not maze (its dead-end pruned copy).
+    """
+    if not job.cancelled.is_set() and maze.digest() == digest:
+        default_cache.store(solved or maze, start, end, algorithm, result)
 
 class MazeSolverGUI:
     def __init__(self, root):
@@ -10,6 +47,9 @@ class MazeSolverGUI:
         self.root.title("Maze Solver")
         self.root.configure(bg="#f5f5f5")
         self.edit_mode = False
+        self.live_solver = None  # Incremental solver kept alive while editing
+        self.job = None  # BackgroundJob currently solving or generating
+        self.animation = None  # Pending root.after id of the path animation
         
         # Configure styles
         self.style = ttk.Style()
@@ -53,9 +93,21 @@ class MazeSolverGUI:
         
         # Maze settings
         self.rows, self.cols = 15, 15
-        self.cell_size = 30
+        self.cell_size = self.fit_cell_size()
         self.difficulty = "medium"
         self.maze = generate_maze(self.rows, self.cols, self.difficulty)
+
+        # Canvas state, see draw_maze
+        self.layout = None  # (rows, cols, cell_size) the cells were laid out for
+        self.cell_items = None  # Item mode: one rectangle per cell
+        self.drawn = None  # Item mode: cell values the items currently show
+        self.image = None  # Image mode: PhotoImage of the visible part of the maze
+        self.image_item = None
+        self.render_pending = None
+        self.explored = None  # Image mode: 1 for every cell the current search expanded
+        self.explore_queue = deque()  # Expansion events not drawn yet
+        self.explore_done = None  # Called once the queue is drawn and the search has finished
+        self.explore_title = ""  # Stats heading while the exploration plays
         
         # UI Elements
         self.create_widgets()
@@ -88,7 +140,22 @@ class MazeSolverGUI:
                               height=self.rows * self.cell_size,
                               bg="white", highlightthickness=0)
         self.canvas.bind("<Button-1>", self.handle_cell_click)
-        self.canvas.pack()
+        self.canvas.grid(row=0, column=0)
+
+        # Scrollbars for mazes larger than the view; the canvas re-renders on scroll
+        x_scroll = ttk.Scrollbar(shadow, orient="horizontal",
+                                 command=lambda *args: self.scroll("x", *args))
+        y_scroll = ttk.Scrollbar(shadow, orient="vertical",
+                                 command=lambda *args: self.scroll("y", *args))
+        x_scroll.grid(row=1, column=0, sticky="ew")
+        y_scroll.grid(row=0, column=1, sticky="ns")
+        self.canvas.config(xscrollcommand=x_scroll.set, yscrollcommand=y_scroll.set)
+        self.canvas.bind("<Configure>", lambda event: self.schedule_render())
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.canvas.bind(sequence, self.handle_wheel)
+        self.root.bind("<plus>", lambda event: self.zoom(2))
+        self.root.bind("<equal>", lambda event: self.zoom(2))
+        self.root.bind("<minus>", lambda event: self.zoom(0.5))
         
         # Control panel with card styling
         control_frame = ttk.Frame(main_frame, style="Stats.TFrame", padding=10)
@@ -100,9 +167,9 @@ class MazeSolverGUI:
         self.algorithm_var = tk.StringVar(value="BFS")
         self.algorithm_menu = ttk.Combobox(control_frame,
                                          textvariable=self.algorithm_var,
-                                         values=["BFS", "DFS", "A*"],
+                                         values=list(ALGORITHMS),
                                          state="readonly",
-                                         width=8)
+                                         width=12)
         self.algorithm_menu.grid(row=0, column=1, padx=(0,10))
 
         ttk.Label(control_frame,
@@ -128,11 +195,27 @@ class MazeSolverGUI:
                   text="Compare All",
                   command=self.compare_algorithms,
                   style="Primary.TButton").grid(row=0, column=6, padx=5, pady=5)
+        self.edit_button = ttk.Button(control_frame,
+                                      text="Edit Mode",
+                                      command=self.toggle_edit_mode,
+                                      name="edit_btn",
+                                      style="Danger.TButton")
+        self.edit_button.grid(row=0, column=7, padx=5, pady=5)
         ttk.Button(control_frame,
-                  text="Edit Mode",
-                  command=self.toggle_edit_mode,
-                  name="edit_btn",
-                  style="Danger.TButton").grid(row=0, column=7, padx=5, pady=5)
+                  text="Save",
+                  command=self.save_maze_file).grid(row=0, column=8, padx=5, pady=5)
+        ttk.Button(control_frame,
+                  text="Load",
+                  command=self.load_maze_file).grid(row=0, column=9, padx=5, pady=5)
+        self.cancel_button = ttk.Button(control_frame,
+                                        text="Cancel",
+                                        command=self.cancel_job,
+                                        state="disabled")
+        self.cancel_button.grid(row=0, column=10, padx=5, pady=5)
+        self.prune_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(control_frame,
+                        text="Prune dead ends",
+                        variable=self.prune_var).grid(row=1, column=0, columnspan=2, sticky="w")
         
         # Stats panel with card styling
         stats_frame = ttk.Frame(main_frame, style="Stats.TFrame", padding=10)
@@ -149,107 +232,431 @@ class MazeSolverGUI:
     def toggle_edit_mode(self):
         """Toggles edit mode for adding/removing walls."""
         self.edit_mode = not self.edit_mode
-        btn = self.root.nametowidget("edit_btn")
+        btn = self.edit_button
         if self.edit_mode:
             btn.config(style="Danger.TButton")
-            self.update_stats("✏️ EDIT MODE ACTIVE\nClick cells to add/remove walls")
             self.canvas.config(cursor="hand2")
+            self.reset_live_solver()
         else:
             btn.config(style="TButton")
+            self.live_solver = None
+            self.canvas.delete("live_path")
             self.update_stats("Edit mode inactive")
             self.canvas.config(cursor="")
 
-    def handle_cell_click(self, event):
-        """Handles cell clicks when in edit mode."""
+    def reset_live_solver(self):
+        """
+        Starts a fresh incremental solve of the current maze for edit mode.
+        The first solve searches the whole maze, so it runs in the background;
+        clicks are ignored until it is done and only repairs run on the Tk thread.
+        """
+        self.live_solver = None
+        self.canvas.delete("live_path")
         if not self.edit_mode:
             return
+        maze, end = self.maze, (self.rows - 1, self.cols - 1)
+
+        def work(job):
+            solver = IncrementalSolver(maze, (0, 0), end)
+            return solver, solver.solve()
+
+        def on_done(value):
+            if self.edit_mode and maze is self.maze:
+                self.live_solver, result = value
+                self.show_live_path(result)
+
+        self.run_in_background("Solving live path...", work, on_done)
+
+    def show_live_path(self, result=None, color="#90CAF9"):
+        """Re-solves incrementally (unless given the result) and redraws only the live path overlay."""
+        path, nodes, time_taken = result or self.live_solver.solve()
+        self.canvas.delete("live_path")
+        self.draw_path(path or [], color, "live_path")
+        self.update_stats("✏️ EDIT MODE ACTIVE\nClick cells to add/remove walls\n"
+                          f"Live Path Length: {len(path) if path else 'N/A'}\n"
+                          f"Nodes Updated: {nodes}\n"
+                          f"Update Time: {time_taken*1000:.2f} ms")
+
+    def handle_cell_click(self, event):
+        """Handles cell clicks when in edit mode."""
+        if not self.edit_mode or self.job is not None:
+            return  # The maze must not change under a running solve
             
-        col = event.x // self.cell_size
-        row = event.y // self.cell_size
+        col = int(self.canvas.canvasx(event.x)) // self.cell_size
+        row = int(self.canvas.canvasy(event.y)) // self.cell_size
         
         # Don't allow editing start/end points
         if (row, col) in [(0, 0), (self.rows-1, self.cols-1)]:
             return
             
-        # Toggle wall/path
-        self.maze[row][col] = 1 - self.maze[row][col]
-        self.draw_maze()
+        if not self.maze.in_bounds(row, col):
+            return
+
+        # Toggle wall/path, then repair the live path and redraw only what changed
+        if self.live_solver is None:
+            # No live solver (its first solve was cancelled or could not
+            # start): edit the maze and solve it afresh in the background
+            self.maze.toggle(row, col)
+            self.draw_cell(row, col)
+            self.reset_live_solver()
+            return
+        self.live_solver.toggle(row, col)
+        self.draw_cell(row, col)
+        self.show_live_path()
+
+    def fit_cell_size(self):
+        """Largest cell size (up to MAX_CELL_SIZE) that fits the maze in VIEW_SIZE pixels."""
+        return max(1, min(MAX_CELL_SIZE, VIEW_SIZE // max(self.rows, self.cols)))
+
+    def image_mode(self):
+        return self.rows * self.cols > ITEM_MODE_LIMIT
+
+    def draw_cell(self, r, c):
+        """Redraws a single wall or path cell after it changed."""
+        index = r * self.cols + c
+        fill, outline = WALL_COLORS if self.maze.cells[index] == 1 else OPEN_COLORS
+        if self.cell_items is not None:
+            self.canvas.itemconfig(self.cell_items[index], fill=fill, outline=outline)
+            self.drawn[index] = self.maze.cells[index]
+        elif self.image is not None:
+            # Only the visible part of the maze is in the image
+            x0, y0 = self.canvas.coords(self.image_item)
+            x1, y1 = c * self.cell_size - int(x0), r * self.cell_size - int(y0)
+            if 0 <= x1 < self.image.width() and 0 <= y1 < self.image.height():
+                self.image.put(fill, to=(x1, y1, x1 + self.cell_size, y1 + self.cell_size))
 
     def draw_maze(self):
-        """Draws the maze grid with improved visuals."""
-        self.canvas.delete("all")
-        for r in range(self.rows):
-            for c in range(self.cols):
-                x1, y1 = c * self.cell_size, r * self.cell_size
-                x2, y2 = x1 + self.cell_size, y1 + self.cell_size
-                
-                if self.maze[r][c] == 1:  # Wall
-                    self.canvas.create_rectangle(x1, y1, x2, y2, 
-                                               fill="#333333", 
-                                               outline="#555555",
-                                               width=2)
-                else:  # Path
-        
-                    self.canvas.create_rectangle(x1, y1, x2, y2, 
-                                               fill="#f8f8f8", 
-                                               outline="#dddddd",
-                                               width=2)
-        
-        # Draw start and end points
-        self.canvas.create_rectangle(0, 0, self.cell_size, self.cell_size, 
-                                   fill="#4CAF50", outline="#388E3C")  # Start (green)
-        self.canvas.create_rectangle((self.cols-1)*self.cell_size, (self.rows-1)*self.cell_size, 
-                                   self.cols*self.cell_size, self.rows*self.cell_size,
-                                   fill="#F44336", outline="#D32F2F")  # End (red)
+        """
+        Brings the canvas up to date with the maze. Small mazes are drawn as
+        one persistent rectangle per cell, and later calls only recolor the
+        cells whose value changed; larger ones (over ITEM_MODE_LIMIT cells) as
+        an image of just the visible part, re-rendered when the view scrolls.
+        Everything is laid out from scratch only when the maze size or the
+        cell size changes. Path overlays are left alone (see clear_paths).
+        """
+        cs = self.cell_size
+        if self.layout != (self.rows, self.cols, cs):
+            self.layout = (self.rows, self.cols, cs)
+            self.canvas.delete("maze")
+            self.cell_items = self.drawn = self.image = self.image_item = None
+            width, height = self.cols * cs, self.rows * cs
+            self.canvas.config(width=min(width, VIEW_SIZE), height=min(height, VIEW_SIZE),
+                               scrollregion=(0, 0, width, height))
+            if self.image_mode():
+                self.image_item = self.canvas.create_image(0, 0, anchor="nw", tags="maze")
+            else:
+                line_width = 2 if cs >= 8 else 0
+                self.drawn = bytearray(self.maze.cells)
+                self.cell_items = [
+                    self.canvas.create_rectangle(c * cs, r * cs, (c + 1) * cs, (r + 1) * cs,
+                                                 fill=colors[0], outline=colors[1],
+                                                 width=line_width, tags="maze")
+                    for r in range(self.rows) for c in range(self.cols)
+                    for colors in [WALL_COLORS if self.drawn[r * self.cols + c] == 1 else OPEN_COLORS]]
+
+            # Draw start and end points
+            self.canvas.create_rectangle(0, 0, cs, cs,
+                                         fill="#4CAF50", outline="#388E3C", tags="maze")  # Start (green)
+            self.canvas.create_rectangle((self.cols-1)*cs, (self.rows-1)*cs,
+                                         self.cols*cs, self.rows*cs,
+                                         fill="#F44336", outline="#D32F2F", tags="maze")  # End (red)
+            self.canvas.tag_lower("maze")
+        elif self.cell_items is not None:
+            cells, drawn = self.maze.cells, self.drawn
+            for index in range(len(drawn)):
+                if drawn[index] != cells[index]:
+                    self.draw_cell(*divmod(index, self.cols))
+        if self.image_item is not None:
+            self.render_viewport()
+
+    def render_viewport(self):
+        """Renders the visible cells (and explored marks) into the image as a binary PPM."""
+        self.render_pending = None
+        if self.image_item is None:
+            return
+        cs, cols = self.cell_size, self.cols
+        width = self.canvas.winfo_width() if self.canvas.winfo_width() > 1 else int(self.canvas.cget("width"))
+        height = self.canvas.winfo_height() if self.canvas.winfo_height() > 1 else int(self.canvas.cget("height"))
+        left, top = int(self.canvas.canvasx(0)) // cs, int(self.canvas.canvasy(0)) // cs
+        right = min(cols, left + width // cs + 2)
+        bottom = min(self.rows, top + height // cs + 2)
+
+        lines = []
+        for r in range(top, bottom):
+            row = bytes(self.maze.cells[r * cols + left:r * cols + right])
+            if self.explored is not None:
+                # Cells are 0/1 bytes, so shifting the whole row as one integer
+                # moves every explored flag to bit 1 of its own byte
+                explored = self.explored[r * cols + left:r * cols + right]
+                row = (int.from_bytes(row, "big") | int.from_bytes(explored, "big") << 1).to_bytes(len(row), "big")
+            if cs > 1:  # Repeat every byte cs times with cs strided slice assignments
+                scaled = bytearray(len(row) * cs)
+                for k in range(cs):
+                    scaled[k::cs] = row
+                row = bytes(scaled)
+            pixels = bytearray(3 * len(row))
+            for k, table in enumerate(IMAGE_CHANNELS):
+                pixels[k::3] = row.translate(table)
+            lines.append(bytes(pixels) * cs)
+        header = b"P6 %d %d 255\n" % ((right - left) * cs, (bottom - top) * cs)
+        self.image = tk.PhotoImage(data=header + b"".join(lines), format="ppm")
+        self.canvas.itemconfig(self.image_item, image=self.image)
+        self.canvas.coords(self.image_item, left * cs, top * cs)
+
+    def schedule_render(self):
+        """Re-renders the image once the current burst of scroll events is handled."""
+        if self.image_item is not None and self.render_pending is None:
+            self.render_pending = self.root.after_idle(self.render_viewport)
+
+    def scroll(self, axis, *args):
+        """Scrollbar command: moves the view and re-renders the visible cells."""
+        (self.canvas.xview if axis == "x" else self.canvas.yview)(*args)
+        self.schedule_render()
+
+    def handle_wheel(self, event):
+        """Mouse wheel scrolls (Shift: horizontally); Ctrl+wheel zooms."""
+        up = event.num == 4 or getattr(event, "delta", 0) > 0
+        if event.state & 0x4:  # Control
+            self.zoom(2 if up else 0.5)
+        elif event.state & 0x1:  # Shift
+            self.scroll("x", "scroll", -3 if up else 3, "units")
+        else:
+            self.scroll("y", "scroll", -3 if up else 3, "units")
+
+    def zoom(self, factor):
+        """Changes the cell size by factor, keeping the center of the view in place."""
+        cell_size = max(1, min(MAX_CELL_SIZE, int(self.cell_size * factor)))
+        if cell_size == self.cell_size:
+            return
+        x_view, y_view = self.canvas.xview(), self.canvas.yview()
+        x_center, y_center = sum(x_view) / 2, sum(y_view) / 2
+        ratio = cell_size / self.cell_size
+        self.cell_size = cell_size
+        self.canvas.scale("path", 0, 0, ratio, ratio)
+        self.canvas.scale("live_path", 0, 0, ratio, ratio)
+        self.canvas.scale("explored", 0, 0, ratio, ratio)
+        self.draw_maze()
+        x_view, y_view = self.canvas.xview(), self.canvas.yview()
+        self.canvas.xview_moveto(x_center - (x_view[1] - x_view[0]) / 2)
+        self.canvas.yview_moveto(y_center - (y_view[1] - y_view[0]) / 2)
+        self.schedule_render()
+
+    def clear_paths(self):
+        """Removes solution paths and explored cells drawn over the maze."""
+        self.stop_animation()
+        self.canvas.delete("path")
+        self.canvas.delete("explored")
+        self.explore_queue.clear()
+        self.explore_done = None
+        if self.explored is not None:
+            self.explored = None
+            self.schedule_render()
+
+    def queue_exploration(self, batch):
+        """Takes a batch of expansion events from a step-streaming solve and plays it."""
+        self.explore_queue.extend(batch)
+        if self.animation is None:
+            self.play_exploration()
+
+    def play_exploration(self):
+        """
+        Draws the next frame of queued expansion events: EXPLORE_STEP of them,
+        or more while the search runs ahead of the animation. Calls
+        explore_done when the queue is empty and the search has finished.
+        """
+        queue = self.explore_queue
+        events = [queue.popleft() for _ in range(min(len(queue), max(EXPLORE_STEP, len(queue) // EXPLORE_CATCHUP)))]
+        if events:
+            self.draw_explored([cell for cell, _, _, _ in events])
+            (r, c), frontier, g, f = events[-1]
+            self.update_stats(f"{self.explore_title}\n"
+                              f"Expanded: ({r}, {c})   g = {g}   f = {f}\n"
+                              f"Frontier size: {frontier:,}")
+        if queue:
+            self.animation = self.root.after(ANIMATION_MS, self.play_exploration)
+        else:
+            self.animation = None
+            if self.explore_done is not None:
+                done, self.explore_done = self.explore_done, None
+                done()
+
+    def draw_explored(self, cells):
+        """Marks expanded cells: one rectangle each in item mode, pixels in image mode."""
+        if self.image_item is not None:
+            if self.explored is None:
+                self.explored = bytearray(self.rows * self.cols)
+            for r, c in cells:
+                self.explored[r * self.cols + c] = 1
+            self.schedule_render()
+            return
+        cs = self.cell_size
+        for r, c in cells:
+            if (r, c) not in [(0, 0), (self.rows-1, self.cols-1)]:
+                self.canvas.create_rectangle(c * cs, r * cs, (c + 1) * cs, (r + 1) * cs,
+                                             fill=EXPLORED_COLOR, outline=EXPLORED_COLOR, tags="explored")
+
+    def draw_path(self, cells, color, tag="path"):
+        """
+        Draws path cells over the maze. In item mode every cell but the start
+        and end gets a rectangle; in image mode the cells become one polyline,
+        which keeps long paths on huge mazes to a single canvas item.
+        """
+        cs = self.cell_size
+        if self.image_item is not None:
+            points = [coord for r, c in cells for coord in (c * cs + cs / 2, r * cs + cs / 2)]
+            if len(points) >= 4:
+                self.canvas.create_line(*points, fill=color, width=max(1, cs * 0.6), tags=tag)
+            return
+        for r, c in cells:
+            if (r, c) not in [(0, 0), (self.rows-1, self.cols-1)]:
+                x1, y1 = c * cs, r * cs
+                self.canvas.create_rectangle(x1, y1, x1 + cs, y1 + cs,
+                                             fill=color, outline=color, tags=tag)
+
+    def run_in_background(self, title, work, on_done, *args, on_steps=None):
+        """
+        Runs work(job, *args) on a worker thread and calls on_done(result) on
+        the Tk thread when it finishes. Progress lines from the job are shown
+        under title until then, and batches it sends as "steps" events go to
+        on_steps. Returns False if another job is still running.
+        """
+        if self.job is not None:
+            return False
+        self.stop_animation()
+        self.job = BackgroundJob(work, *args).start()
+        self.cancel_button.config(state="normal")
+        self.update_stats(title)
+        self.root.after(POLL_MS, self.poll_job, self.job, title, on_done, on_steps)
+        return True
+
+    def poll_job(self, job, title, on_done, on_steps=None):
+        """Drains the job's event queue; reschedules itself until the job ends."""
+        if job is not self.job:
+            return  # Cancelled: whatever the thread still produces is ignored
+        progress = None
+        while not job.events.empty():
+            kind, value = job.events.get_nowait()
+            if kind == "progress":
+                progress = value
+                continue
+            if kind == "steps":
+                on_steps(value)
+                continue
+            self.finish_job()
+            if kind == "done":
+                on_done(value)
+            elif kind == "error":
+                messagebox.showerror("Error", str(value))
+                self.update_stats(f"Failed: {value}")
+            else:
+                self.update_stats("Cancelled")
+            return
+        if progress is not None:
+            self.update_stats(f"{title}\n{progress}")
+        self.root.after(POLL_MS, self.poll_job, job, title, on_done, on_steps)
+
+    def finish_job(self):
+        self.job = None
+        self.cancel_button.config(state="disabled")
+
+    def cancel_job(self):
+        """Stops the running job (if the solver checks in) and any animation."""
+        self.stop_animation()
+        self.explore_done = None
+        if self.job is not None:
+            self.job.cancel()
+            self.finish_job()
+            self.update_stats("Cancelled")
 
     def solve_maze(self):
-        """Solves the maze with animation and stats."""
+        """
+        Solves the maze in the background, then animates the path and shows
+        stats. Solvers with a step-streaming variant (STEP_SOLVERS) also
+        animate the search itself: the worker forwards each batch of
+        expansion events and the canvas plays them back frame by frame.
+        Results already in the solve cache are shown straight away.
+        With "Prune dead ends" ticked the solver runs on the maze with its
+        dead ends filled in (pruned in the background and remembered).
+        """
         start, end = (0, 0), (self.rows - 1, self.cols - 1)
         algorithm = self.algorithm_var.get()
         self.difficulty = self.difficulty_var.get().lower()
-        
-        # Clear previous solution
-        self.draw_maze()
-        self.update_stats("Solving maze...")
-        
-        # Solve with selected algorithm
-        if algorithm == "BFS":
-            path, nodes, time_taken = bfs(self.maze, start, end)
-        elif algorithm == "DFS":
-            path, nodes, time_taken = dfs(self.maze, start, end)
-        else:  # A*
-            path, nodes, time_taken = a_star(self.maze, start, end)
-        
-        # Display results
-        if path:
-            self.animate_solution(path)
-            stats = (f"Algorithm: {algorithm}\n"
-                    f"Path Length: {len(path)}\n"
-                    f"Nodes Expanded: {nodes}\n"
-                    f"Time Taken: {time_taken*1000:.2f} ms\n"
-                    f"Difficulty: {self.difficulty.capitalize()}")
-            self.update_stats(stats)
+        steps = STEP_SOLVERS.get(ALGORITHMS[algorithm])
+        maze = self.maze  # self.maze may be replaced while a cancelled solve still runs
+        prune = self.prune_var.get()
+
+        def work(job):
+            digest = maze.digest()
+            grid = pruned_grid(maze, start, end) if prune else maze
+            if prune:
+                result = default_cache.lookup(grid, start, end, algorithm)
+                if result is not None:
+                    return result
+            if steps is None:
+                result = ALGORITHMS[algorithm](ProgressGrid(grid, job, algorithm), start, end)
+            else:
+                def forward(batch):
+                    job.check()
+                    job.send("steps", batch)
+
+                result = run_steps(steps(grid, start, end), forward)
+            cache_result(job, maze, digest, start, end, algorithm, result, grid)
+            return result
+
+        def show_result(result, cached=False):
+            path, nodes, time_taken = result
+            if path:
+                self.animate_solution(path)
+                stats = (f"Algorithm: {algorithm}{' (dead ends pruned)' if prune else ''}\n"
+                        f"Path Length: {len(path)}\n"
+                        f"Nodes Expanded: {nodes}\n"
+                        f"Time Taken: {time_taken*1000:.2f} ms{' (cached)' if cached else ''}\n"
+                        f"Difficulty: {self.difficulty.capitalize()}")
+                self.update_stats(stats)
+            else:
+                messagebox.showwarning("No Solution", "No path found!")
+                self.update_stats("No solution found!")
+
+        def on_done(result):
+            # Let the exploration animation catch up before showing the path
+            self.explore_done = lambda: show_result(result)
+            if self.animation is None:
+                self.play_exploration()
+
+        if self.job is None:
+            self.clear_paths()  # Clear previous solution
+            cached = None if prune else default_cache.lookup(self.maze, start, end, algorithm)
+            if cached is not None:
+                self.stop_animation()
+                show_result(cached, cached=True)
+                return
+            self.explore_title = f"Solving maze with {algorithm}..."
+        self.run_in_background(self.explore_title, work, on_done, on_steps=self.queue_exploration)
+
+    def animate_solution(self, path, color="#2196F3", on_done=None, first=0):
+        """
+        Animates the solution path with customizable color from root.after
+        callbacks, so the window stays responsive: ANIMATION_STEP cells per
+        frame, or more for paths longer than ANIMATION_FRAMES steps.
+        on_done is called after the last frame.
+        """
+        step = max(ANIMATION_STEP, len(path) // ANIMATION_FRAMES)
+        # Image-mode segments overlap by one cell so the polylines stay connected
+        overlap = 1 if first and self.image_item is not None else 0
+        self.draw_path(path[first - overlap:first + step], color)
+        first += step
+        if first < len(path):
+            self.animation = self.root.after(ANIMATION_MS, self.animate_solution,
+                                             path, color, on_done, first)
         else:
-            messagebox.showwarning("No Solution", "No path found!")
-            self.update_stats("No solution found!")
-
-    def animate_solution(self, path, color="#2196F3"):
-        """Animates the solution path with customizable color."""
-        for i, (r, c) in enumerate(path):
-            x1, y1 = c * self.cell_size, r * self.cell_size
-            x2, y2 = x1 + self.cell_size, y1 + self.cell_size
-            
-            # Skip coloring start and end points
-            if (r, c) not in [(0, 0), (self.rows-1, self.cols-1)]:
-                self.canvas.create_rectangle(x1, y1, x2, y2, 
-                                           fill=color, outline=color)
-                
-            # Update display every 10 steps for performance
-            if i % 10 == 0:
-                self.root.update()
-                time.sleep(0.01)
-        
-        self.root.update()
+            self.animation = None
+            if on_done:
+                on_done()
+
+    def stop_animation(self):
+        if self.animation is not None:
+            self.root.after_cancel(self.animation)
+            self.animation = None
 
     def update_stats(self, text):
         """Updates the statistics display."""
@@ -259,59 +666,119 @@ class MazeSolverGUI:
         self.stats_text.config(state="disabled")
 
     def regenerate_maze(self):
-        """Generates a new random maze with selected difficulty."""
+        """Generates a new random maze with selected difficulty in the background."""
         self.difficulty = self.difficulty_var.get().lower()
-        self.maze = generate_maze(self.rows, self.cols, self.difficulty)
+
+        def on_done(maze):
+            self.maze = maze
+            self.clear_paths()
+            self.draw_maze()
+            self.update_stats("New maze generated!")
+            self.reset_live_solver()
+
+        self.run_in_background("Generating maze...",
+                               lambda job, *args: generate_maze(*args), on_done,
+                               self.rows, self.cols, self.difficulty)
+
+    def save_maze_file(self):
+        """Saves the current maze as a binary .maze file or a text file."""
+        path = filedialog.asksaveasfilename(defaultextension=".maze",
+                                            filetypes=[("Maze files", "*.maze"),
+                                                       ("Text mazes", "*.txt")])
+        if not path:
+            return
+        if path.endswith(".txt"):
+            write_text_maze(path, self.maze)
+        else:
+            save_maze(path, self.maze, generator="random")
+        self.update_stats(f"Maze saved to {path}")
+
+    def load_maze_file(self):
+        """Loads a maze from a binary .maze file or a text file."""
+        path = filedialog.askopenfilename(filetypes=[("Maze files", "*.maze"),
+                                                     ("Text mazes", "*.txt"),
+                                                     ("All files", "*.*")])
+        if not path or self.job is not None:
+            return
+        try:
+            if is_binary_maze(path):
+                maze, _ = load_maze(path, mode="c")  # Copy-on-write so edit mode works
+            else:
+                maze = read_text_maze(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("Load Failed", str(e))
+            return
+        self.maze = maze
+        self.rows, self.cols = maze.rows, maze.cols
+        self.cell_size = self.fit_cell_size()
+        self.clear_paths()
         self.draw_maze()
-        self.update_stats("New maze generated!")
+        self.update_stats(f"Loaded {self.rows}x{self.cols} maze from {path}")
+        self.reset_live_solver()
 
     def compare_algorithms(self):
-        """Compares all three algorithms and displays results in the GUI."""
+        """
+        Compares all available algorithms in the background and displays
+        results in the GUI. Cached results (e.g. from solve_maze on the same
+        maze) are reused. "Prune dead ends" applies as in solve_maze.
+        """
         start, end = (0, 0), (self.rows - 1, self.cols - 1)
-        self.draw_maze()
-        self.update_stats("Running comparison...")
-        self.root.update()
-        
-        # Run all algorithms
-        bfs_path, bfs_nodes, bfs_time = bfs(self.maze, start, end)
-        dfs_path, dfs_nodes, dfs_time = dfs(self.maze, start, end)
-        astar_path, astar_nodes, astar_time = a_star(self.maze, start, end)
-        
+        maze = self.maze  # self.maze may be replaced while a cancelled comparison still runs
+        prune = self.prune_var.get()
+
+        def work(job):
+            digest = maze.digest()
+            grid = pruned_grid(maze, start, end) if prune else maze
+            results = {}
+            for i, (name, solver) in enumerate(ALGORITHMS.items(), 1):
+                job.check()
+                job.report(f"{name} ({i}/{len(ALGORITHMS)})")
+                result = default_cache.lookup(grid, start, end, name)
+                if result is None:
+                    result = solver(ProgressGrid(grid, job, f"{name} ({i}/{len(ALGORITHMS)})"),
+                                    start, end)
+                    cache_result(job, maze, digest, start, end, name, result, grid)
+                results[name] = result
+            return results
+
+        if self.job is None:
+            self.clear_paths()
+        self.run_in_background("Running comparison...", work, self.show_comparison)
+
+    def show_comparison(self, results):
+        """Shows the comparison bars and animates each algorithm's path in turn."""
         # Format comparison results with visual indicators
-        max_nodes = max(bfs_nodes, dfs_nodes, astar_nodes)
-        max_time = max(bfs_time, dfs_time, astar_time)
+        max_nodes = max(nodes for _, nodes, _ in results.values())
+        max_time = max(time_taken for _, _, time_taken in results.values())
+        label_width = max(len(name) for name in results) + 1
         
         def get_bar(value, max_value, width=20):
             filled = int((value / max_value) * width) if max_value > 0 else 0
             return '█' * filled + ' ' * (width - filled)
         
-        results = (
-            
-            
-            "Nodes Expanded:\n"
-            f"BFS: {bfs_nodes:<6} {get_bar(bfs_nodes, max_nodes)}\n"
-            f"DFS: {dfs_nodes:<6} {get_bar(dfs_nodes, max_nodes)}\n"
-            f"A*:  {astar_nodes:<6} {get_bar(astar_nodes, max_nodes)}\n\n"
-            
-            "Time Taken (ms):\n"
-            f"BFS: {bfs_time*1000:.2f} {get_bar(bfs_time, max_time)}\n"
-            f"DFS: {dfs_time*1000:.2f} {get_bar(dfs_time, max_time)}\n"
-            f"A*:  {astar_time*1000:.2f} {get_bar(astar_time, max_time)}\n\n"
-            
-            
-        )
+        lines = ["Nodes Expanded:"]
+        for name, (_, nodes, _) in results.items():
+            lines.append(f"{name + ':':<{label_width}} {nodes:<6} {get_bar(nodes, max_nodes)}")
+        lines.append("")
+        lines.append("Time Taken (ms):")
+        for name, (_, _, time_taken) in results.items():
+            lines.append(f"{name + ':':<{label_width}} {time_taken*1000:.2f} {get_bar(time_taken, max_time)}")
         
-        # Show best path from each algorithm
-        if bfs_path:
-            self.animate_solution(bfs_path, color="#4CAF50")  # Green for BFS
-            time.sleep(0.5)
-        if dfs_path:
-            self.animate_solution(dfs_path, color="#FFC107")  # Amber for DFS
-            time.sleep(0.5)
-        if astar_path:
-            self.animate_solution(astar_path, color="#2196F3")  # Blue for A*
-            
-        self.update_stats(results)
+        self.update_stats("\n".join(lines))
+
+        # Show best path from each algorithm, one after another
+        paths = [(path, PATH_COLORS[i % len(PATH_COLORS)])
+                 for i, (path, _, _) in enumerate(results.values()) if path]
+
+        def animate_next(i=0):
+            if i < len(paths):
+                path, color = paths[i]
+                self.animate_solution(path, color, on_done=lambda: pause(i + 1))
+
+        def pause(i):
+            self.animation = self.root.after(500, animate_next, i) if i < len(paths) else None
+
+        animate_next()
 
 # Run the application
 if __name__ == "__main__":
@@ -1,7 +1,13 @@
-from tkinter import Tk
-from gui import MazeSolverGUI
+import sys
 
 if __name__ == "__main__":
+    # With arguments, run the headless batch solver instead of the GUI
+    if len(sys.argv) > 1:
+        from batch import main
+        sys.exit(main(sys.argv[1:]))
+
+    from tkinter import Tk
+    from gui import MazeSolverGUI
     root = Tk()
     app = MazeSolverGUI(root)
     root.mainloop()
@@ -1,54 +1,355 @@
 import random
+from grid import Grid, as_grid, np
+from maze_io import format_text_maze
+from search_algorithms import bfs, bfs_wavefront
 
-def generate_maze(rows, cols, difficulty='medium'):
+WALL_PROBABILITY = {
+    'easy': 0.2,
+    'medium': 0.3,
+    'hard': 0.4
+}
+
+def generate_maze(rows, cols, difficulty='medium', method='repair', seed=None):
     """
     Generates a random maze with guaranteed path from start to end.
     0 -> Open path
     1 -> Wall
     The start position is (0,0) and the end position is (rows-1, cols-1).
     Difficulty options: 'easy', 'medium', 'hard'
+    Method options:
+      'repair' - draw one random grid; if it is unsolvable, carve a random
+                 walk from start to end through it (default, one check)
+      'carve'  - draw one random grid and always carve a random walk (no check)
+      'reject' - redraw random grids until one is solvable (original behaviour;
+                 slow near the percolation threshold on large mazes)
+    Pass a seed to make the maze reproducible.
+    Returns a Grid (one byte per cell).
     """
-    wall_prob = {
-        'easy': 0.2,
-        'medium': 0.3,
-        'hard': 0.4
-    }.get(difficulty, 0.3)
-    
-    # Generate maze with guaranteed path
+    rng = random.Random(seed)
+    wall_prob = WALL_PROBABILITY.get(difficulty, 0.3)
+    start, end = (0, 0), (rows - 1, cols - 1)
+    if method not in ('repair', 'carve', 'reject'):
+        raise ValueError(f"Unknown generation method: {method}")
+
     while True:
-        maze = [[0 if random.random() > wall_prob else 1 for _ in range(cols)] for _ in range(rows)]
-        maze[0][0] = 0  # Ensure start is open
-        maze[rows-1][cols-1] = 0  # Ensure end is open
-        
+        maze = random_grid(rows, cols, wall_prob, rng)
+        maze.cells[0] = 0  # Ensure start is open
+        maze.cells[-1] = 0  # Ensure end is open
+
+        if method == 'carve':
+            carve_path(maze, start, end, rng)
+            return maze
         # Check if there's a path from start to end
-        if is_solvable(maze, (0,0), (rows-1, cols-1)):
+        if is_solvable(maze, start, end):
             return maze
+        if method == 'repair':
+            carve_path(maze, start, end, rng)
+            return maze
+
+def random_grid(rows, cols, wall_prob, rng=random):
+    """
+    Returns a Grid where each cell is a wall with probability wall_prob.
+    Cells are drawn as random bytes and thresholded with bytes.translate,
+    so filling even millions of cells runs at C speed.
+    """
+    threshold = round(wall_prob * 256)
+    table = bytes(1 if b < threshold else 0 for b in range(256))
+    cells = bytearray(rng.randbytes(rows * cols).translate(table))
+    return Grid(rows, cols, cells)
+
+def random_terrain(rows, cols, max_cost=9, patch=8, rng=random):
+    """
+    Returns rows * cols step costs (a bytearray of values 1..max_cost) laid out
+    in square patches of patch x patch cells with one random cost each, so the
+    terrain has regions worth going around rather than per-cell noise.
+    Each patch row is widened with strided slice assignment, one slice per
+    column offset, so no Python loop runs per cell.
+    """
+    if not 1 <= max_cost <= 255:
+        raise ValueError("max_cost must be between 1 and 255")
+    table = bytes(b % max_cost + 1 for b in range(256))
+    patch_cols = -(-cols // patch)
+    costs = bytearray()
+    for _ in range(-(-rows // patch)):
+        coarse = rng.randbytes(patch_cols).translate(table)
+        row = bytearray(patch_cols * patch)
+        for offset in range(patch):
+            row[offset::patch] = coarse
+        costs += row[:cols] * min(patch, rows - len(costs) // cols)
+    return costs
+
+def generate_terrain_maze(rows, cols, difficulty='easy', max_cost=9, patch=8, seed=None):
+    """
+    Generates a weighted maze: a random maze (as generate_maze) whose open
+    cells cost 1..max_cost to step onto, from random_terrain. Solve it with
+    dijkstra or a_star to get the cheapest rather than the shortest path.
+    Returns a Grid with costs.
+    """
+    rng = random.Random(seed)
+    maze = generate_maze(rows, cols, difficulty, seed=rng.randrange(2**32))
+    return Grid(rows, cols, maze.cells, random_terrain(rows, cols, max_cost, patch, rng))
+
+def carve_path(maze, start, end, rng=random):
+    """
+    Opens every cell along a random walk from start to end, biased towards end.
+    Half of the steps move towards end and the rest go in a random direction,
+    so the carved corridor winds but stays O(rows + cols) long.
+    """
+    grid = as_grid(maze)
+    cells, rows, cols = grid.cells, grid.rows, grid.cols
+    (r, c), (er, ec) = start, end
+    cells[r * cols + c] = 0
+    while (r, c) != (er, ec):
+        if rng.random() < 0.5:
+            # Step towards the end along an axis that still needs to move
+            if r != er and (c == ec or rng.random() < 0.5):
+                r += 1 if er > r else -1
+            else:
+                c += 1 if ec > c else -1
+        else:
+            dr, dc = rng.choice([(-1, 0), (1, 0), (0, -1), (0, 1)])
+            if 0 <= r + dr < rows and 0 <= c + dc < cols:
+                r, c = r + dr, c + dc
+        cells[r * cols + c] = 0
 
 def is_solvable(maze, start, end):
-    """Check if there's a path from start to end using BFS."""
-    rows, cols = len(maze), len(maze[0])
-    queue = [start]
-    visited = set([start])
-    
-    while queue:
-        x, y = queue.pop(0)
-        if (x, y) == end:
-            return True
-            
-        for dx, dy in [(-1,0),(1,0),(0,-1),(0,1)]:
-            nx, ny = x + dx, y + dy
-            if (0 <= nx < rows and 0 <= ny < cols and 
-                maze[nx][ny] == 0 and (nx, ny) not in visited):
-                visited.add((nx, ny))
-                queue.append((nx, ny))
-    return False
+    """
+    Check if there's a path from start to end.
+    Uses the vectorized wavefront BFS when NumPy is available,
+    otherwise the flat-index deque BFS.
+    """
+    grid = as_grid(maze)
+    solver = bfs_wavefront if np is not None else bfs
+    path, _, _ = solver(grid, start, end)
+    return path is not None
+
+# Perfect mazes
+#
+# The generators below produce perfect mazes (exactly one path between any two
+# open cells). Maze cells sit on the even (row, col) positions of the grid and
+# the odd positions between two cells are passages that are either carved or
+# left as walls. When rows or cols is even, the end cell (rows-1, cols-1) is
+# off that lattice, so a short dead-end tail joins it to the nearest cell.
+
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Up, Down, Left, Right
+
+def _walled_grid(rows, cols):
+    """Returns (Grid, cell_rows, cell_cols) with every position set to wall."""
+    grid = Grid(rows, cols, bytearray(b"\x01") * (rows * cols))
+    return grid, (rows + 1) // 2, (cols + 1) // 2
+
+def _carve(grid, i, j, di=0, dj=0):
+    """Opens lattice cell (i, j) and, if given, the passage towards (i+di, j+dj)."""
+    cols = grid.cols
+    grid.cells[2 * i * cols + 2 * j] = 0
+    grid.cells[(2 * i + di) * cols + 2 * j + dj] = 0
+
+def _tail_start(rows, cols):
+    """Returns the last lattice cell (R, C) the end tail hangs off."""
+    return (rows - 1) // 2 * 2, (cols - 1) // 2 * 2
+
+def _connect_end(grid):
+    """Carves the dead-end tail from the last lattice cell to (rows-1, cols-1)."""
+    rows, cols, cells = grid.rows, grid.cols, grid.cells
+    tail_row, tail_col = _tail_start(rows, cols)
+    for r in range(tail_row, rows):
+        cells[r * cols + tail_col] = 0
+    for c in range(tail_col, cols):
+        cells[(rows - 1) * cols + c] = 0
+    return grid
+
+def generate_backtracker_maze(rows, cols, seed=None):
+    """
+    Recursive backtracker (randomized depth-first search), run with an explicit stack.
+    Produces long, winding corridors with few branches.
+    """
+    rng = random.Random(seed)
+    grid, h, w = _walled_grid(rows, cols)
+    visited = bytearray(h * w)
+    visited[0] = 1
+    _carve(grid, 0, 0)
+    stack = [(0, 0)]
+
+    while stack:
+        i, j = stack[-1]
+        options = [(di, dj) for di, dj in DIRECTIONS
+                   if 0 <= i + di < h and 0 <= j + dj < w and not visited[(i + di) * w + j + dj]]
+        if not options:
+            stack.pop()
+            continue
+        di, dj = rng.choice(options)
+        _carve(grid, i, j, di, dj)
+        _carve(grid, i + di, j + dj)
+        visited[(i + di) * w + j + dj] = 1
+        stack.append((i + di, j + dj))
+
+    return _connect_end(grid)
+
+def generate_kruskal_maze(rows, cols, seed=None):
+    """
+    Randomized Kruskal's algorithm.
+    Walls between cells are removed in random order whenever they separate two
+    different union-find sets. Produces many short dead ends.
+    """
+    rng = random.Random(seed)
+    grid, h, w = _walled_grid(rows, cols)
+    parent = list(range(h * w))
+
+    def find(k):
+        while parent[k] != k:
+            parent[k] = parent[parent[k]]  # Path halving
+            k = parent[k]
+        return k
+
+    edges = [(i, j, 0, 1) for i in range(h) for j in range(w - 1)]
+    edges += [(i, j, 1, 0) for i in range(h - 1) for j in range(w)]
+    rng.shuffle(edges)
+
+    for i in range(h):
+        for j in range(w):
+            _carve(grid, i, j)
+    for i, j, di, dj in edges:
+        a, b = find(i * w + j), find((i + di) * w + j + dj)
+        if a != b:
+            parent[a] = b
+            _carve(grid, i, j, di, dj)
+
+    return _connect_end(grid)
+
+def generate_wilson_maze(rows, cols, seed=None):
+    """
+    Wilson's algorithm (loop-erased random walks).
+    Samples uniformly from all spanning trees of the cell lattice, so the maze
+    has no directional bias. Slow to start on big grids while the tree is small.
+    """
+    rng = random.Random(seed)
+    grid, h, w = _walled_grid(rows, cols)
+    in_tree = bytearray(h * w)
+    heading = bytearray(h * w)  # Last direction taken out of each cell by the walk
+    root = rng.randrange(h * w)
+    in_tree[root] = 1
+    _carve(grid, *divmod(root, w))
+
+    for k in range(h * w):
+        if in_tree[k]:
+            continue
+        # Random walk until the tree is hit; overwriting headings erases loops
+        cell = k
+        while not in_tree[cell]:
+            i, j = divmod(cell, w)
+            while True:
+                d = rng.randrange(4)
+                di, dj = DIRECTIONS[d]
+                if 0 <= i + di < h and 0 <= j + dj < w:
+                    break
+            heading[cell] = d
+            cell = (i + di) * w + j + dj
+        # Retrace the loop-erased walk and add it to the tree
+        cell = k
+        while not in_tree[cell]:
+            i, j = divmod(cell, w)
+            di, dj = DIRECTIONS[heading[cell]]
+            _carve(grid, i, j, di, dj)
+            in_tree[cell] = 1
+            cell = (i + di) * w + j + dj
+
+    return _connect_end(grid)
+
+def eller_rows(rows, cols, seed=None):
+    """
+    Eller's algorithm as a row generator.
+    Yields the maze one grid row at a time (a bytearray of length cols), keeping
+    only O(cols) state, so arbitrarily tall mazes can be streamed to disk or
+    into a solver without materializing the whole grid.
+    """
+    rng = random.Random(seed)
+    h, w = (rows + 1) // 2, (cols + 1) // 2
+    tail_row, tail_col = _tail_start(rows, cols)
+    labels = list(range(w))
+    next_label = w
+
+    for i in range(h):
+        last = i == h - 1
+        cell_row = bytearray(b"\x01") * cols
+        for j in range(w):
+            cell_row[2 * j] = 0
+
+        # Join horizontally adjacent cells from different sets (always on the last row)
+        parent = {}
+
+        def find(label):
+            while parent.get(label, label) != label:
+                label = parent[label]
+            return label
+
+        for j in range(w - 1):
+            a, b = find(labels[j]), find(labels[j + 1])
+            if a != b and (last or rng.random() < 0.5):
+                parent[b] = a
+                cell_row[2 * j + 1] = 0
+        labels = [find(label) for label in labels]
+
+        if last:
+            if 2 * i == rows - 1:
+                cell_row[tail_col:] = bytes(cols - tail_col)
+            yield cell_row
+            if 2 * i != rows - 1:
+                tail = bytearray(b"\x01") * cols
+                tail[tail_col:] = bytes(cols - tail_col)
+                yield tail
+            return
+
+        # Every set carries at least one cell down into the next row
+        members = {}
+        for j, label in enumerate(labels):
+            members.setdefault(label, []).append(j)
+        passage_row = bytearray(b"\x01") * cols
+        next_labels = [None] * w
+        for label, columns in members.items():
+            down = [j for j in columns if rng.random() < 0.5] or [rng.choice(columns)]
+            for j in down:
+                passage_row[2 * j] = 0
+                next_labels[j] = label
+        for j in range(w):
+            if next_labels[j] is None:
+                next_labels[j] = next_label
+                next_label += 1
+        labels = next_labels
+
+        yield cell_row
+        yield passage_row
+
+def generate_eller_maze(rows, cols, seed=None):
+    """Eller's algorithm, collected from eller_rows into a Grid."""
+    cells = bytearray()
+    for row in eller_rows(rows, cols, seed):
+        cells += row
+    return Grid(rows, cols, cells)
+
+# Maze generators selectable by name
+GENERATORS = {
+    'random': generate_maze,
+    'backtracker': generate_backtracker_maze,
+    'kruskal': generate_kruskal_maze,
+    'wilson': generate_wilson_maze,
+    'eller': generate_eller_maze,
+    'terrain': generate_terrain_maze,
+}
+
+def create_maze(generator, rows, cols, seed=None, **options):
+    """
+    Builds a maze with the generator registered under the given name.
+    Extra options (e.g. difficulty for 'random') are passed through.
+    """
+    if generator not in GENERATORS:
+        raise ValueError(f"Unknown maze generator: {generator}")
+    return GENERATORS[generator](rows, cols, seed=seed, **options)
 
 def print_maze(maze):
     """
     Prints the maze in a readable format.
     """
-    for row in maze:
-        print("".join(["█" if cell == 1 else " " for cell in row]))
+    print(format_text_maze(maze))
 
 # Example Usage
 if __name__ == "__main__":
@@ -0,0 +1,322 @@
+import heapq
+import re
+import time
+from array import array
+from functools import wraps
+from grid import as_grid
+
+SOURCE, TARGET = -1, -2  # Virtual graph nodes for a start/end inside a corridor
+
+# Bits of an open_directions() byte
+UP, DOWN, LEFT, RIGHT, WALL_BIT = 1, 2, 4, 8, 16
+STEPS = (UP, DOWN, LEFT, RIGHT)
+OPPOSITE = [0, DOWN, UP, 0, RIGHT, 0, 0, 0, LEFT]
+DEGREES = bytes(bin(mask).count("1") if mask < WALL_BIT else 255 for mask in range(256))  # Walls never reach 1
+CORRIDOR_MASKS = [mask for mask in range(WALL_BIT) if bin(mask).count("1") == 2]
+CORRIDOR_PATTERN = re.compile(b"[" + bytes(CORRIDOR_MASKS) + b"]")
+NODE_CELLS = bytes(mask < WALL_BIT and mask not in CORRIDOR_MASKS for mask in range(256))
+CORRIDOR_CELLS = bytes(mask in CORRIDOR_MASKS for mask in range(256))
+
+def open_directions(maze):
+    """
+    Returns one byte per cell: for an open cell, one bit per open neighbor
+    (UP, DOWN, LEFT, RIGHT); WALL_BIT for a wall. The whole grid is done at
+    once with big-integer shifts, one byte lane per cell, so no cell needs
+    its own neighbors() call.
+    """
+    grid = as_grid(maze)
+    rows, cols, size = grid.rows, grid.cols, grid.size
+    walls = int.from_bytes(grid.cells, "big")
+    opens = int.from_bytes(b"\x01" * size, "big") ^ walls
+    not_first = int.from_bytes((b"\x00" + b"\x01" * (cols - 1)) * rows, "big")
+    not_last = int.from_bytes((b"\x01" * (cols - 1) + b"\x00") * rows, "big")
+    up = opens & (opens >> 8 * cols)
+    down = opens & (opens << 8 * cols)
+    left = opens & not_first & (opens >> 8)
+    right = opens & not_last & (opens << 8)
+    return (up | down << 1 | left << 2 | right << 3 | walls << 4).to_bytes(size, "big")
+
+def _offsets(cols):
+    """Flat index step for each direction bit."""
+    offset = [0] * 9
+    offset[UP], offset[DOWN], offset[LEFT], offset[RIGHT] = -cols, cols, -1, 1
+    return offset
+
+def prune_dead_ends(maze, keep=()):
+    """
+    Returns a copy of maze with every dead end filled in: open cells with at
+    most one open neighbor are turned into walls, repeatedly, until none are
+    left. Cells listed in keep (usually start and end) are never filled.
+    A dead-end branch can never be part of a path between two kept cells, so
+    every such path survives, while searches stop wandering into the branches.
+    """
+    grid = as_grid(maze).copy()
+    cells, offset = grid.cells, _offsets(grid.cols)
+    keep = {grid.index(*cell) for cell in keep}
+    directions = open_directions(grid)
+    degree = bytearray(directions.translate(DEGREES))
+    stack = [match.start() for match in re.finditer(b"[\x00\x01]", degree)]
+
+    while stack:
+        index = stack.pop()
+        if cells[index] or index in keep:
+            continue
+        cells[index] = 1
+        mask = directions[index]
+        for bit in STEPS:
+            n_index = index + offset[bit]
+            if mask & bit and not cells[n_index]:
+                degree[n_index] -= 1
+                if degree[n_index] == 1:
+                    stack.append(n_index)
+    return grid
+
+def pruned_grid(maze, start, end):
+    """
+    prune_dead_ends(maze, keep=(start, end)), remembered on the grid for the
+    last start and end it was asked for until the next toggle().
+    """
+    grid = as_grid(maze)
+    keep = (tuple(start), tuple(end))
+    last = grid.derived("pruned", lambda grid: {})
+    if keep not in last:
+        last.clear()
+        last[keep] = prune_dead_ends(grid, keep)
+    return last[keep]
+
+def with_dead_end_pruning(solver):
+    """
+    Wraps any solver from search_algorithms so that it runs on the maze with
+    dead ends pruned (keeping start and end). time_taken includes the pruning
+    when this call had to do it (see pruned_grid).
+    """
+    @wraps(solver)
+    def pruned_solver(maze, start, end, *args, **kwargs):
+        start_time = time.perf_counter()
+        pruned = pruned_grid(maze, start, end)
+        prune_time = time.perf_counter() - start_time
+        path, nodes_expanded, time_taken = solver(pruned, start, end, *args, **kwargs)
+        return path, nodes_expanded, time_taken + prune_time
+
+    return pruned_solver
+
+class CorridorGraph:
+    """
+    Junction graph of a maze. Every open cell whose number of open neighbors is
+    not 2 (junctions and dead ends) becomes a node; each chain of two-neighbor
+    corridor cells between two nodes collapses into one edge weighted by its
+    length in steps, and neighboring nodes are joined by a step of 1. Pure
+    corridor loops get one of their cells as a node.
+    Everything is kept in flat arrays: directions (see open_directions) tells
+    nodes from corridor cells, edge e runs through the cells
+        [edge_a[e]] + edge_cells[edge_offset[e]:edge_offset[e + 1]] + [edge_b[e]]
+    and cell_edge holds each corridor cell's edge (-1 for other cells), so a
+    start or end inside a corridor can be attached to the two ends of its
+    edge at query time. The graph depends only on the maze and
+    can be reused for any number of queries.
+    """
+
+    def __init__(self, maze):
+        grid = as_grid(maze)
+        self.rows, self.cols = grid.rows, grid.cols
+        self.directions = directions = open_directions(grid)
+        self.cell_edge = array('i', [-1]) * grid.size
+        self.edge_a, self.edge_b = array('i'), array('i')
+        self.edge_offset, self.edge_cells = array('i', [0]), array('i')
+        self.loop_nodes = set()
+
+        # Only nodes next to a corridor cell start an edge; find them all at once
+        rows, cols, size = grid.rows, grid.cols, grid.size
+        nodes = int.from_bytes(directions.translate(NODE_CELLS), "big")
+        corridors = int.from_bytes(directions.translate(CORRIDOR_CELLS), "big")
+        beside = (corridors << 8 * cols | corridors >> 8 * cols
+                  | corridors >> 8 & int.from_bytes((b"\x00" + b"\x01" * (cols - 1)) * rows, "big")
+                  | corridors << 8 & int.from_bytes((b"\x01" * (cols - 1) + b"\x00") * rows, "big"))
+        for match in re.finditer(b"\x01", (nodes & beside).to_bytes(size, "big")):
+            self._trace_edges(match.start())
+        # Corridor loops with no junction on them are still unassigned
+        if len(self.edge_cells) < sum(directions.count(mask) for mask in CORRIDOR_MASKS):
+            for match in re.finditer(CORRIDOR_PATTERN, directions):
+                index = match.start()
+                if self.cell_edge[index] == -1 and index not in self.loop_nodes:
+                    self.loop_nodes.add(index)
+                    self._trace_edges(index)
+
+    @property
+    def node_count(self):
+        return self.directions.translate(NODE_CELLS).count(1) + len(self.loop_nodes)
+
+    @property
+    def edge_count(self):
+        return len(self.edge_a)
+
+    def is_node(self, index):
+        return NODE_CELLS[self.directions[index]] == 1 or index in self.loop_nodes
+
+    def _trace_edges(self, node):
+        """Follows every corridor leaving node and records each edge once."""
+        directions, cell_edge, edge_cells = self.directions, self.cell_edge, self.edge_cells
+        offset = _offsets(self.cols)
+        mask = directions[node]
+        for bit in STEPS:
+            current = node + offset[bit]
+            if not mask & bit or cell_edge[current] != -1 or not CORRIDOR_CELLS[directions[current]]:
+                continue  # No corridor that way, or traced from its other end already
+            edge, heading = len(self.edge_a), bit
+            while CORRIDOR_CELLS[directions[current]] and current != node:  # Until the next node
+                cell_edge[current] = edge
+                edge_cells.append(current)
+                heading = directions[current] ^ OPPOSITE[heading]
+                current += offset[heading]
+            self.edge_a.append(node)
+            self.edge_b.append(current)
+            self.edge_offset.append(len(edge_cells))
+
+    def _edge_sequence(self, edge):
+        offset = self.edge_offset
+        return [self.edge_a[edge]] + list(self.edge_cells[offset[edge]:offset[edge + 1]]) + [self.edge_b[edge]]
+
+    def _locate(self, index):
+        """(edge, position in its edge sequence) of a corridor cell."""
+        edge = self.cell_edge[index]
+        first = self.edge_offset[edge]
+        return edge, self.edge_cells.index(index, first, self.edge_offset[edge + 1]) - first + 1
+
+    def _attach(self, index):
+        """
+        Returns the ways to enter the graph from a cell: a list of
+        (node, steps, edge, cell position, node position) in edge-sequence terms.
+        """
+        if self.cell_edge[index] == -1:
+            return None if self.directions[index] < WALL_BIT else []  # Node, or wall
+        edge, pos = self._locate(index)
+        length = self.edge_offset[edge + 1] - self.edge_offset[edge] + 1
+        return [(self.edge_a[edge], pos, edge, pos, 0),
+                (self.edge_b[edge], length - pos, edge, pos, length)]
+
+    def solve(self, start, end):
+        """
+        A* over the junction graph (Manhattan distance is admissible because
+        every edge is at least as long as the straight distance it spans).
+        The result is expanded back into a cell path.
+        nodes_expanded counts graph nodes taken off the heap.
+        Returns: (path, nodes_expanded, time_taken)
+        """
+        cols, directions, cell_edge = self.cols, self.directions, self.cell_edge
+        edge_a, edge_b, edge_offset, edge_cells = self.edge_a, self.edge_b, self.edge_offset, self.edge_cells
+        offset = _offsets(cols)
+        start_time = time.perf_counter()
+        start_index, end_index = start[0] * cols + start[1], end[0] * cols + end[1]
+        if start_index == end_index:
+            return [start], 1, time.perf_counter() - start_time
+
+        start_links, end_links = self._attach(start_index), self._attach(end_index)
+        source = start_index if start_links is None else SOURCE
+        target = end_index if end_links is None else TARGET
+        # Hops into the virtual target, keyed by the node they leave from
+        into_target = {}
+        for node, steps, edge, cell_pos, node_pos in end_links or []:
+            into_target.setdefault(node, []).append((TARGET, steps, edge, node_pos, cell_pos))
+
+        source_hops = start_links or []
+        if start_links and end_links:
+            (edge, p), (end_edge, q) = self._locate(start_index), self._locate(end_index)
+            if edge == end_edge:
+                source_hops.append((TARGET, abs(p - q), edge, p, q))  # Both inside one corridor
+
+        er, ec = end
+        g_score = {source: 0}
+        parent = {source: None}
+        closed = set()
+        counter = 0  # Breaks ties in push order
+        pq = [(abs(start[0] - er) + abs(start[1] - ec), 0, counter, source)]
+        nodes_expanded = 0
+
+        while pq:
+            _, neg_g, _, u = heapq.heappop(pq)
+            if u in closed:
+                continue  # Stale entry
+            closed.add(u)
+            nodes_expanded += 1
+            if u == target:
+                return self._expand(parent, target, start), nodes_expanded, time.perf_counter() - start_time
+
+            # Hops: (node, steps, edge or -1 for a single step, from, to) in edge-sequence terms
+            if u == SOURCE:
+                hops = source_hops
+            else:
+                hops = []
+                mask = directions[u]
+                for bit in STEPS:
+                    if mask & bit:
+                        v = u + offset[bit]
+                        edge = cell_edge[v]
+                        if edge == -1:
+                            hops.append((v, 1, -1, u, v))  # Neighboring node
+                            continue
+                        weight = edge_offset[edge + 1] - edge_offset[edge] + 1
+                        if edge_a[edge] == u and edge_cells[edge_offset[edge]] == v:
+                            hops.append((edge_b[edge], weight, edge, 0, weight))
+                        else:
+                            hops.append((edge_a[edge], weight, edge, weight, 0))
+                if u in into_target:
+                    hops.extend(into_target[u])
+
+            for v, weight, edge, from_pos, to_pos in hops:
+                new_g = weight - neg_g
+                if v not in closed and new_g < g_score.get(v, new_g + 1):
+                    g_score[v] = new_g
+                    parent[v] = (u, edge, from_pos, to_pos)
+                    counter += 1
+                    if v == TARGET:
+                        heapq.heappush(pq, (new_g, -new_g, counter, v))
+                    else:
+                        r, c = divmod(v, cols)
+                        heapq.heappush(pq, (new_g + abs(r - er) + abs(c - ec), -new_g, counter, v))
+
+        return None, nodes_expanded, time.perf_counter() - start_time  # No solution found
+
+    def _expand(self, parent, target, start):
+        """Turns the chain of graph hops ending at target into a cell path."""
+        cols = self.cols
+        segments = []
+        node = target
+        while parent[node] is not None:
+            node, edge, from_pos, to_pos = parent[node]
+            if edge == -1:
+                segments.append([from_pos, to_pos])  # One step between neighboring nodes
+                continue
+            sequence = self._edge_sequence(edge)
+            step = 1 if to_pos >= from_pos else -1
+            segments.append(sequence[from_pos:to_pos + step if to_pos + step >= 0 else None:step])
+        path = [start]
+        for segment in reversed(segments):
+            path.extend(divmod(index, cols) for index in segment[1:])
+        return path
+
+def corridor_a_star(maze, start, end):
+    """
+    Answers the query on the maze's CorridorGraph, which is built on the first
+    call and remembered on the grid until the next toggle().
+    Returns: (path, nodes_expanded, time_taken), time_taken including the
+    build when this call had to do it.
+    """
+    start_time = time.perf_counter()
+    graph = as_grid(maze).derived("corridor_graph", CorridorGraph)
+    build_time = time.perf_counter() - start_time
+    path, nodes_expanded, time_taken = graph.solve(start, end)
+    return path, nodes_expanded, time_taken + build_time
+
+# Example Usage
+if __name__ == "__main__":
+    from maze import create_maze
+    from search_algorithms import a_star
+    maze = create_maze("kruskal", 201, 201, seed=1)
+    start, end = (0, 0), (200, 200)
+    graph = CorridorGraph(maze)
+    print(f"Cells: {maze.size}, graph nodes: {graph.node_count}, edges: {graph.edge_count}")
+    print(f"{'Solver':<20}{'Path Length':<15}{'Nodes Expanded':<15}{'Time (ms)':<10}")
+    for name, solver in [("A*", a_star), ("Pruned A*", with_dead_end_pruning(a_star)),
+                         ("Corridor graph", lambda m, s, e: graph.solve(s, e))]:
+        path, nodes, time_taken = solver(maze, start, end)
+        print(f"{name:<20}{len(path) if path else 'N/A':<15}{nodes:<15}{time_taken*1000:.2f}")
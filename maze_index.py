@@ -0,0 +1,247 @@
+import struct
+import sys
+import time
+from array import array
+from collections import deque
+from grid import as_grid, np
+from search_algorithms import UNREACHED, a_star, distance_field, heuristic
+
+# Mazes with at most this many cells get an exact all-pairs next-hop table
+ALL_PAIRS_LIMIT = 1024
+
+# Index file (.idx): a 32-byte little-endian header followed by int32 arrays:
+#   magic "MIDX", version, flags, reserved, rows, cols, landmark count,
+#   Grid.cells_digest() of the maze it was built from
+# then the landmark cell indices, one distance field per landmark and,
+# with FLAG_ALL_PAIRS, the rows*cols x rows*cols next-hop table.
+INDEX_MAGIC = b"MIDX"
+INDEX_VERSION = 1
+FLAG_ALL_PAIRS = 0x01
+INDEX_HEADER = struct.Struct("<4sBBHIII16s")
+
+class MazeIndex:
+    """
+    Precomputed distance index for answering many start/end queries on one maze.
+    BFS distance fields from a few landmark cells (picked by farthest-point
+    sampling) give the ALT heuristic: by the triangle inequality,
+    |d(L, cell) - d(L, goal)| never overestimates the distance from cell to goal,
+    and the best landmark is usually far tighter than Manhattan distance, so A*
+    expands little more than the path itself. Mazes with at most
+    ALL_PAIRS_LIMIT cells also get an exact next-hop table, which answers a
+    query by walking the path directly. The landmark fields count steps, so on
+    weighted grids they still bound the cost (a_star scales them by the
+    cheapest step cost), but the step-based next-hop table is never built.
+    The index remembers the grid version it was built for and rebuilds itself
+    on the next query after the grid has been edited through Grid.toggle().
+    """
+
+    def __init__(self, maze, landmarks=8, all_pairs=None):
+        self.grid = as_grid(maze)
+        self.landmark_count = landmarks
+        self.all_pairs = self.grid.size <= ALL_PAIRS_LIMIT if all_pairs is None else all_pairs
+        self.all_pairs = self.all_pairs and not self.grid.weighted
+        self.landmarks = []
+        self.distances = []
+        self.next_hop = None
+        self.version = None
+        self.build()
+
+    def build(self):
+        """(Re)computes the landmark distance fields and, if enabled, the next-hop table."""
+        self.landmarks, self.distances = _select_landmarks(self.grid, self.landmark_count)
+        self.next_hop = _build_next_hop(self.grid) if self.all_pairs else None
+        self.version = self.grid.version
+
+    def is_current(self):
+        """Returns False once the grid has been edited since the index was built."""
+        return self.version == self.grid.version
+
+    def heuristic_to(self, end):
+        """Returns an ALT heuristic function of (cell, goal) for the fixed goal end."""
+        cols = self.grid.cols
+        end_index = end[0] * cols + end[1]
+        goal_distances = [(dist, dist[end_index]) for dist in self.distances
+                          if dist[end_index] != UNREACHED]
+
+        def alt_heuristic(cell, goal):
+            best = heuristic(cell, goal)
+            index = cell[0] * cols + cell[1]
+            for dist, goal_dist in goal_distances:
+                d = dist[index]
+                if d != UNREACHED and abs(d - goal_dist) > best:
+                    best = abs(d - goal_dist)
+            return best
+
+        return alt_heuristic
+
+    def solve(self, start, end):
+        """
+        Answers one shortest-path query. Walks the next-hop table when there is
+        one (nodes_expanded is then the path length), otherwise runs A* with
+        the landmark heuristic.
+        Returns: (path, nodes_expanded, time_taken)
+        """
+        if not self.is_current():
+            self.build()
+        if self.next_hop is None:
+            return a_star(self.grid, start, end, self.heuristic_to(end))
+
+        start_time = time.perf_counter()
+        grid, next_hop, size = self.grid, self.next_hop, self.grid.size
+        index, end_index = grid.index(*start), grid.index(*end)
+        row = end_index * size  # Next hops towards end
+        path = [start]
+        while index != end_index:
+            index = next_hop[row + index]
+            if index == -1:
+                return None, len(path), time.perf_counter() - start_time  # No solution found
+            path.append(divmod(index, grid.cols))
+        return path, len(path), time.perf_counter() - start_time  # Solution found
+
+    def save(self, path):
+        """Writes the index to path (conventionally the maze file name plus '.idx')."""
+        if not self.is_current():
+            self.build()
+        header = INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION,
+                                   FLAG_ALL_PAIRS if self.next_hop is not None else 0, 0,
+                                   self.grid.rows, self.grid.cols, len(self.landmarks),
+                                   self.grid.cells_digest())
+        with open(path, "wb") as f:
+            f.write(header)
+            for values in [array('i', self.landmarks)] + self.distances + (
+                    [self.next_hop] if self.next_hop is not None else []):
+                f.write(_to_little_endian(values))
+
+    @classmethod
+    def load(cls, path, maze):
+        """
+        Reads an index saved for maze. Raises ValueError if the file was built
+        from a different maze (checked by size and cell digest).
+        """
+        grid = as_grid(maze)
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) < INDEX_HEADER.size:
+            raise ValueError("File too short for a maze index header")
+        magic, version, flags, _, rows, cols, count, digest = INDEX_HEADER.unpack_from(data)
+        if magic != INDEX_MAGIC:
+            raise ValueError("Not a maze index file")
+        if version != INDEX_VERSION:
+            raise ValueError(f"Unsupported maze index version {version}")
+        if (rows, cols) != (grid.rows, grid.cols) or digest != grid.cells_digest():
+            raise ValueError("Maze index does not match this maze")
+
+        size = rows * cols
+        offset = INDEX_HEADER.size
+
+        def read_ints(count):
+            nonlocal offset
+            values = _from_little_endian(data[offset:offset + 4 * count])
+            if len(values) != count:
+                raise ValueError("Maze index file is truncated")
+            offset += 4 * count
+            return values
+
+        index = cls.__new__(cls)
+        index.grid = grid
+        index.landmark_count = count
+        index.landmarks = list(read_ints(count))
+        index.distances = [read_ints(size) for _ in range(count)]
+        index.all_pairs = bool(flags & FLAG_ALL_PAIRS)
+        index.next_hop = read_ints(size * size) if index.all_pairs else None
+        index.version = grid.version
+        return index
+
+def _to_little_endian(values):
+    if sys.byteorder == "big":
+        values = array('i', values)
+        values.byteswap()
+    return values.tobytes()
+
+def _from_little_endian(data):
+    values = array('i')
+    values.frombytes(data[:len(data) // 4 * 4])
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+def _select_landmarks(grid, count):
+    """
+    Farthest-point sampling: the first landmark is the cell farthest from the
+    start corner (or the first open cell), each next one the cell farthest
+    from all landmarks chosen so far. Only the component containing that
+    first cell is covered. Returns (landmark indices, distance fields).
+    """
+    seed_index = 0 if grid.cells[0] == 0 else bytes(grid.cells).find(0)
+    if seed_index == -1:
+        return [], []  # No open cells at all
+    nearest = distance_field(grid, grid.coords(seed_index))
+    landmarks, distances = [], []
+    for _ in range(count):
+        index = _argmax_reachable(nearest)
+        if index == -1 or nearest[index] == 0 and landmarks:
+            break  # Every reachable cell already is a landmark
+        dist = distance_field(grid, grid.coords(index))
+        landmarks.append(index)
+        distances.append(dist)
+        nearest = _minimum(nearest, dist) if len(landmarks) > 1 else dist
+    return landmarks, distances
+
+def _argmax_reachable(values):
+    """Index of the largest value other than UNREACHED, or -1 if there is none."""
+    if np is not None:
+        view = np.frombuffer(values, dtype=np.int32)
+        masked = np.where(view == UNREACHED, -1, view)
+        index = int(masked.argmax())
+        return index if masked[index] >= 0 else -1
+    best, best_index = -1, -1
+    for index, value in enumerate(values):
+        if value != UNREACHED and value > best:
+            best, best_index = value, index
+    return best_index
+
+def _minimum(a, b):
+    """Elementwise minimum of two int32 arrays."""
+    if np is not None:
+        return array('i', np.minimum(np.frombuffer(a, dtype=np.int32),
+                                     np.frombuffer(b, dtype=np.int32)).tobytes())
+    return array('i', map(min, a, b))
+
+def _build_next_hop(grid):
+    """
+    Exact all-pairs routing table. Row t holds, for every cell s, the neighbor
+    of s one step closer to t (-1 if t is unreachable from s, or s == t). It is
+    the predecessor array of a BFS rooted at t, since the grid is undirected.
+    """
+    size = grid.size
+    next_hop = array('i', [-1]) * (size * size)
+    neighbors = grid.neighbors
+    for target in range(size):
+        if grid.cells[target] != 0:
+            continue
+        parent = array('i', [-1]) * size
+        seen = bytearray(size)
+        seen[target] = 1
+        queue = deque([target])
+        while queue:
+            index = queue.popleft()
+            for n_index in neighbors(index):
+                if not seen[n_index]:
+                    seen[n_index] = 1
+                    parent[n_index] = index
+                    queue.append(n_index)
+        next_hop[target * size:(target + 1) * size] = parent
+    return next_hop
+
+# Example Usage
+if __name__ == "__main__":
+    import random
+    from maze import generate_maze
+    maze = generate_maze(200, 200, 'medium', seed=1)
+    index = MazeIndex(maze)
+    open_cells = [maze.coords(i) for i in range(maze.size) if maze.cells[i] == 0]
+    rng = random.Random(1)
+    print(f"{'Start':<12}{'End':<12}{'A* nodes':<12}{'ALT nodes':<12}")
+    for _ in range(5):
+        start, end = rng.choice(open_cells), rng.choice(open_cells)
+        print(f"{str(start):<12}{str(end):<12}{a_star(maze, start, end)[1]:<12}{index.solve(start, end)[1]:<12}")
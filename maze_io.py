@@ -0,0 +1,179 @@
+import mmap
+import struct
+from collections import namedtuple
+from grid import Grid, as_grid
+
+# Characters accepted as walls / open cells in text mazes ("█" and " " match print_maze)
+WALL_CHARS = "█#1"
+OPEN_CHARS = " .0"
+
+def parse_text_maze(text):
+    """
+    Parses a text maze in the print_maze format into a Grid.
+    Walls are '█', '#' or '1'; open cells are ' ', '.' or '0'.
+    Every row must be as wide as the first: a ragged or empty row (e.g. an
+    editor stripped trailing spaces) raises ValueError instead of silently
+    changing the maze's size.
+    """
+    lines = text.splitlines()
+    if not lines:
+        raise ValueError("Text maze is empty")
+    rows, cols = len(lines), len(lines[0])
+    cells = bytearray(rows * cols)
+    for r, line in enumerate(lines):
+        if len(line) != cols or not line:
+            raise ValueError(f"Row {r} has {len(line)} cells, expected {cols} as in row 0"
+                             " (were trailing spaces stripped?)")
+        for c, ch in enumerate(line):
+            if ch in WALL_CHARS:
+                cells[r * cols + c] = 1
+            elif ch not in OPEN_CHARS:
+                raise ValueError(f"Unexpected character {ch!r} at row {r}, col {c}")
+    return Grid(rows, cols, cells)
+
+def read_text_maze(path):
+    """Reads a text maze file (see parse_text_maze)."""
+    with open(path, encoding="utf-8") as f:
+        return parse_text_maze(f.read())
+
+def format_text_maze(maze, open_char=" "):
+    """Renders a maze as text, exactly as print_maze prints it (open cells as open_char)."""
+    grid = as_grid(maze)
+    table = {0: open_char, 1: "█"}
+    cols = grid.cols
+    return "\n".join(bytes(grid.cells[r * cols:(r + 1) * cols]).decode("latin-1").translate(table)
+                     for r in range(grid.rows))
+
+def write_text_maze(path, maze):
+    """
+    Writes a maze to a text file in the print_maze format, with open cells as
+    '.' so editors that strip trailing spaces cannot change the maze.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(format_text_maze(maze, "."))
+        f.write("\n")
+
+# Binary maze format (.maze)
+#
+# A fixed 64-byte little-endian header followed by the cell payload:
+#   magic "MAZE", version, flags, reserved,
+#   rows, cols, start row/col, end row/col (uint32),
+#   seed (int64, -1 when unknown), generator name (24 bytes, NUL padded)
+# The payload is one uint8 per cell in row-major order, or, with FLAG_PACKED,
+# one bit per cell (most significant bit first). With FLAG_WEIGHTED the cells
+# are followed by one uint8 step cost (1-255) per cell, never bit-packed.
+# Unpacked files can be memory-mapped and solved in place.
+
+MAGIC = b"MAZE"
+VERSION = 1
+FLAG_PACKED = 0x01
+FLAG_WEIGHTED = 0x02
+HEADER = struct.Struct("<4sBBH6Iq24s")
+NO_SEED = -1
+
+MazeHeader = namedtuple("MazeHeader", "rows cols start end seed generator packed weighted")
+
+def pack_bits(cells):
+    """
+    Packs 0/1 bytes into bits, eight cells per byte, most significant bit first.
+    Each of the eight strided slices is turned into one big integer and shifted
+    into its bit position, so the work runs at C speed without NumPy.
+    """
+    count = len(cells)
+    padded = bytes(cells) + bytes(-count % 8)
+    length = len(padded) // 8
+    value = 0
+    for k in range(8):
+        value |= int.from_bytes(padded[k::8], "big") << (7 - k)
+    return value.to_bytes(length, "big")
+
+def unpack_bits(packed, count):
+    """Inverse of pack_bits: returns a bytearray of count 0/1 cells."""
+    cells = bytearray(len(packed) * 8)
+    for k in range(8):
+        table = bytes((b >> (7 - k)) & 1 for b in range(256))
+        cells[k::8] = packed.translate(table)
+    del cells[count:]
+    return cells
+
+def save_maze(path, maze, start=None, end=None, seed=None, generator="", packed=False):
+    """
+    Writes a maze in the binary .maze format.
+    start/end default to the top-left and bottom-right corners.
+    packed=True stores one bit per cell (8x smaller, but not memory-mappable).
+    The step costs of weighted grids are stored after the cells.
+    """
+    grid = as_grid(maze)
+    start = start or (0, 0)
+    end = end or (grid.rows - 1, grid.cols - 1)
+    name = generator.encode("utf-8")
+    if len(name) > 24:
+        raise ValueError("Generator name must fit in 24 bytes")
+    flags = (FLAG_PACKED if packed else 0) | (FLAG_WEIGHTED if grid.weighted else 0)
+    header = HEADER.pack(MAGIC, VERSION, flags, 0,
+                         grid.rows, grid.cols, *start, *end,
+                         NO_SEED if seed is None else seed, name)
+    with open(path, "wb") as f:
+        f.write(header)
+        f.write(pack_bits(grid.cells) if packed else grid.cells)
+        if grid.weighted:
+            f.write(grid.costs)
+
+def read_header(data):
+    """Parses the 64-byte header at the start of data into a MazeHeader."""
+    if len(data) < HEADER.size:
+        raise ValueError("File too short for a maze header")
+    magic, version, flags, _, rows, cols, sr, sc, er, ec, seed, name = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Not a binary maze file")
+    if version != VERSION:
+        raise ValueError(f"Unsupported maze file version {version}")
+    return MazeHeader(rows, cols, (sr, sc), (er, ec), None if seed == NO_SEED else seed,
+                      name.rstrip(b"\0").decode("utf-8"), bool(flags & FLAG_PACKED),
+                      bool(flags & FLAG_WEIGHTED))
+
+def load_maze(path, mode="r"):
+    """
+    Loads a binary .maze file. Returns (grid, header).
+    Unpacked payloads are memory-mapped, so multi-GB mazes are paged in on demand
+    instead of being read into RAM. mode follows numpy.memmap:
+      'r'  - read-only map (default)
+      'r+' - writable map; edits are written back to the file
+      'c'  - copy-on-write map; edits stay in memory
+    Bit-packed payloads are always unpacked into memory; their step costs
+    (if any) are read along with them.
+    """
+    access = {"r": mmap.ACCESS_READ, "r+": mmap.ACCESS_WRITE, "c": mmap.ACCESS_COPY}[mode]
+    with open(path, "rb" if mode != "r+" else "r+b") as f:
+        header = read_header(f.read(HEADER.size))
+        size = header.rows * header.cols
+        if header.packed:
+            packed = f.read((size + 7) // 8)
+            costs = bytearray(f.read(size)) if header.weighted else None
+            if len(packed) * 8 < size or costs is not None and len(costs) < size:
+                raise ValueError("Maze file payload is truncated")
+            return Grid(header.rows, header.cols, unpack_bits(packed, size), costs), header
+        mapped = mmap.mmap(f.fileno(), 0, access=access)
+    end = HEADER.size + (2 * size if header.weighted else size)
+    if len(mapped) < end:
+        mapped.close()
+        raise ValueError("Maze file payload is truncated")
+    # The memoryviews keep the mapping alive for as long as the grid uses it
+    view = memoryview(mapped)
+    cells = view[HEADER.size:HEADER.size + size]
+    costs = view[HEADER.size + size:end] if header.weighted else None
+    return Grid(header.rows, header.cols, cells, costs), header
+
+def is_binary_maze(path):
+    """Returns True if the file starts with the binary maze magic bytes."""
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+def read_maze(path):
+    """
+    Loads either a binary .maze file or a text maze. Returns (grid, header);
+    header is None for text mazes.
+    """
+    if is_binary_maze(path):
+        return load_maze(path)
+    return read_text_maze(path), None
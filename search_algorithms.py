@@ -1,59 +1,222 @@
 import heapq
+from array import array
 from collections import deque
 import time
+from grid import as_grid, np
+from maze_graph import corridor_a_star
 
-def bfs(maze, start, end):
+def reconstruct_path(parent, cols, end_index):
+    """
+    Walks a flat predecessor array back from end_index to the start.
+    parent[i] holds the flat index (row * cols + col) of the cell that
+    discovered cell i, and -1 for the start cell.
+    Returns the path as a list of (row, col) tuples from start to end.
+    """
+    path = []
+    index = end_index
+    while index != -1:
+        path.append(divmod(index, cols))
+        index = parent[index]
+    path.reverse()
+    return path
+
+
+UNREACHED = 2 ** 31 - 1  # g-score of cells no route has reached yet
+SQRT2 = 2 ** 0.5
+
+
+def new_parent_array(size):
+    """Returns a compact int32 predecessor array with every entry set to -1."""
+    return array('i', [-1]) * size
+
+
+class SolverWorkspace:
+    """
+    Scratch memory that bfs, dfs and a_star can reuse across many solves
+    instead of allocating fresh arrays, a queue and a heap on every call.
+    Visited/closed marks are generation stamps: a cell counts as marked only
+    if its byte equals the current generation, so starting a new solve is a
+    counter increment rather than a clear. The stamp bytes are reallocated
+    once every 255 solves when the counter wraps. Parent and g-score entries
+    are only read for cells stamped in the current solve, so they are never
+    reset. The arrays are resized when a grid of a different size comes in.
+    A workspace must not be shared by solves running at the same time.
+    """
+
+    MAX_GENERATION = 255
+
+    def __init__(self, size=0):
+        self.size = -1
+        self.generation = 0
+        self._allocate(size)
+
+    def _allocate(self, size):
+        self.size = size
+        self.generation = 0
+        self.parent = new_parent_array(size)
+        self.visited = bytearray(size)
+        self.closed = None  # A* arrays are created on first use
+        self.g_score = None
+        self.queue = deque()
+        self.stack = []
+        self.heap = []
+
+    def begin(self, size):
+        """Starts a solve on a grid of size cells and returns its generation stamp."""
+        if size != self.size:
+            self._allocate(size)
+        self.generation += 1
+        if self.generation > self.MAX_GENERATION:
+            self.generation = 1
+            self.visited = bytearray(size)
+            if self.closed is not None:
+                self.closed = bytearray(size)
+        self.queue.clear()
+        self.stack.clear()
+        self.heap.clear()
+        return self.generation
+
+    def a_star_arrays(self):
+        """Returns (closed stamps, g-scores), allocating them on first use."""
+        if self.g_score is None:
+            self.closed = bytearray(self.size)
+            self.g_score = array('i', [UNREACHED]) * self.size
+        return self.closed, self.g_score
+
+
+def bfs(maze, start, end, workspace=None):
     """
     Breadth-First Search Algorithm.
     Explores nodes level by level, ensuring the shortest path in an unweighted grid.
+    Pass a SolverWorkspace to reuse its arrays across many solves.
     Returns: (path, nodes_expanded, time_taken)
     """
-    rows, cols = len(maze), len(maze[0])
-    queue = deque([(start, [start])])
-    visited = set()
-    visited.add(start)
+    grid = as_grid(maze)
+    cols = grid.cols
+    start_index, end_index = grid.index(*start), grid.index(*end)
+    if workspace is None:
+        parent, visited, queue, mark = new_parent_array(grid.size), bytearray(grid.size), deque(), 1
+    else:
+        mark = workspace.begin(grid.size)
+        parent, visited, queue = workspace.parent, workspace.visited, workspace.queue
+        parent[start_index] = -1
+    visited[start_index] = mark
+    queue.append(start_index)
+    neighbors = grid.neighbors
     nodes_expanded = 0
     start_time = time.perf_counter()
 
     while queue:
-        (x, y), path = queue.popleft()
+        index = queue.popleft()
         nodes_expanded += 1
-        if (x, y) == end:
+        if index == end_index:
+            path = reconstruct_path(parent, cols, index)
             return path, nodes_expanded, time.perf_counter() - start_time  # Solution found
 
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:  # Up, Down, Left, Right
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < rows and 0 <= ny < cols and maze[nx][ny] == 0 and (nx, ny) not in visited:
-                queue.append(((nx, ny), path + [(nx, ny)]))
-                visited.add((nx, ny))
+        for n_index in neighbors(index):  # Up, Down, Left, Right
+            if visited[n_index] != mark:
+                visited[n_index] = mark
+                parent[n_index] = index
+                queue.append(n_index)
 
     return None, nodes_expanded, time.perf_counter() - start_time  # No solution found
 
 
-def dfs(maze, start, end):
+def bidirectional_bfs(maze, start, end):
+    """
+    Bidirectional Breadth-First Search.
+    Runs BFS from start and from end at the same time, always expanding one
+    complete layer of the smaller frontier. Whenever a cell is discovered that
+    the other search has already reached, the route through it is a candidate;
+    after the layer that produced the first candidate is finished, the best
+    candidate is a shortest path. nodes_expanded counts both frontiers.
+    Returns: (path, nodes_expanded, time_taken)
+    """
+    grid = as_grid(maze)
+    cols = grid.cols
+    start_index, end_index = grid.index(*start), grid.index(*end)
+    start_time = time.perf_counter()
+    if start_index == end_index:
+        return [start], 1, time.perf_counter() - start_time
+
+    dist = (array('i', [UNREACHED]) * grid.size, array('i', [UNREACHED]) * grid.size)
+    parent = (new_parent_array(grid.size), new_parent_array(grid.size))
+    dist[0][start_index] = 0
+    dist[1][end_index] = 0
+    queues = (deque([start_index]), deque([end_index]))
+    neighbors = grid.neighbors
+    best, meet = UNREACHED, -1
+    nodes_expanded = 0
+
+    while queues[0] and queues[1] and meet == -1:
+        side = 0 if len(queues[0]) <= len(queues[1]) else 1
+        queue, own_dist, own_parent, other_dist = queues[side], dist[side], parent[side], dist[1 - side]
+        for _ in range(len(queue)):  # One complete layer
+            index = queue.popleft()
+            nodes_expanded += 1
+            new_dist = own_dist[index] + 1
+            for n_index in neighbors(index):
+                if own_dist[n_index] == UNREACHED:
+                    own_dist[n_index] = new_dist
+                    own_parent[n_index] = index
+                    queue.append(n_index)
+                    if other_dist[n_index] != UNREACHED and new_dist + other_dist[n_index] < best:
+                        best, meet = new_dist + other_dist[n_index], n_index
+
+    if meet == -1:
+        return None, nodes_expanded, time.perf_counter() - start_time  # No solution found
+    path = join_paths(parent[0], parent[1], cols, meet)
+    return path, nodes_expanded, time.perf_counter() - start_time  # Solution found
+
+
+def join_paths(forward_parent, backward_parent, cols, meet):
+    """
+    Combines the two halves of a bidirectional search at the meeting cell:
+    start -> meet from the forward predecessors, then meet -> end from the
+    backward ones.
+    """
+    path = reconstruct_path(forward_parent, cols, meet)
+    index = backward_parent[meet]
+    while index != -1:
+        path.append(divmod(index, cols))
+        index = backward_parent[index]
+    return path
+
+
+def dfs(maze, start, end, workspace=None):
     """
     Depth-First Search Algorithm.
     Explores paths deeply before backtracking.
+    Pass a SolverWorkspace to reuse its arrays across many solves.
     Returns: (path, nodes_expanded, time_taken)
     """
-    rows, cols = len(maze), len(maze[0])
-    stack = [(start, [start])]
-    visited = set()
-    visited.add(start)
+    grid = as_grid(maze)
+    cols = grid.cols
+    start_index, end_index = grid.index(*start), grid.index(*end)
+    if workspace is None:
+        parent, visited, stack, mark = new_parent_array(grid.size), bytearray(grid.size), [], 1
+    else:
+        mark = workspace.begin(grid.size)
+        parent, visited, stack = workspace.parent, workspace.visited, workspace.stack
+        parent[start_index] = -1
+    visited[start_index] = mark
+    stack.append(start_index)
+    neighbors = grid.neighbors
     nodes_expanded = 0
     start_time = time.perf_counter()
 
     while stack:
-        (x, y), path = stack.pop()
+        index = stack.pop()
         nodes_expanded += 1
-        if (x, y) == end:
+        if index == end_index:
+            path = reconstruct_path(parent, cols, index)
             return path, nodes_expanded, time.perf_counter() - start_time  # Solution found
 
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:  # Up, Down, Left, Right
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < rows and 0 <= ny < cols and maze[nx][ny] == 0 and (nx, ny) not in visited:
-                stack.append(((nx, ny), path + [(nx, ny)]))
-                visited.add((nx, ny))
+        for n_index in neighbors(index):  # Up, Down, Left, Right
+            if visited[n_index] != mark:
+                visited[n_index] = mark
+                parent[n_index] = index
+                stack.append(n_index)
 
     return None, nodes_expanded, time.perf_counter() - start_time  # No solution found
 
@@ -66,56 +229,815 @@ def heuristic(a, b):
     return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
 
-def a_star(maze, start, end):
+def octile_heuristic(a, b):
+    """
+    Octile distance. Exact on 8-connected grids; on this 4-connected grid it
+    underestimates more than Manhattan, so it stays admissible but is weaker.
+    """
+    dx, dy = abs(a[0] - b[0]), abs(a[1] - b[1])
+    return max(dx, dy) + (SQRT2 - 1) * min(dx, dy)
+
+
+def zero_heuristic(a, b):
+    """Always 0, which turns A* into Dijkstra's algorithm."""
+    return 0
+
+
+# Heuristics a_star accepts by name
+HEURISTICS = {
+    "manhattan": heuristic,
+    "octile": octile_heuristic,
+    "zero": zero_heuristic,
+}
+
+
+def a_star(maze, start, end, heuristic_fn=heuristic, workspace=None):
     """
     A* Search Algorithm.
-    Uses a priority queue (min-heap) to expand the most promising node based on cost.
+    Uses a priority queue (min-heap) ordered by f = g + h, breaking ties towards
+    the higher g (the node closer to the goal). Best-known g-scores live in a
+    dense array; a cell is pushed again whenever a shorter route to it is found
+    and the outdated heap entries are skipped when popped (lazy deletion).
+    heuristic_fn is a function of (cell, goal) or a key of HEURISTICS; it must
+    be consistent (never overestimate a single step) for the path to be shortest.
+    nodes_expanded counts cells taken off the heap, not skipped stale entries.
+    On weighted grids a step costs the cost of the cell it enters and the
+    heuristic is multiplied by the cheapest step cost, which keeps it consistent.
+    Pass a SolverWorkspace to reuse its arrays across many solves.
+    Returns: (path, nodes_expanded, time_taken)
+    """
+    if isinstance(heuristic_fn, str):
+        heuristic_fn = HEURISTICS[heuristic_fn]
+    grid = as_grid(maze)
+    cols = grid.cols
+    start_index, end_index = grid.index(*start), grid.index(*end)
+    if workspace is None:
+        parent, seen, pq, mark = new_parent_array(grid.size), bytearray(grid.size), [], 1
+        closed, g_score = bytearray(grid.size), array('i', [UNREACHED]) * grid.size
+    else:
+        mark = workspace.begin(grid.size)
+        closed, g_score = workspace.a_star_arrays()
+        parent, seen, pq = workspace.parent, workspace.visited, workspace.heap
+        parent[start_index] = -1
+    seen[start_index] = mark  # g_score[i] is only valid while seen[i] == mark
+    g_score[start_index] = 0
+    costs, scale = grid.costs, grid.min_cost()
+    pq.append((scale * heuristic_fn(start, end), 0, start_index))  # (f, -g, index)
+    neighbors = grid.neighbors
+    nodes_expanded = 0
+    start_time = time.perf_counter()
+
+    while pq:
+        _, neg_g, index = heapq.heappop(pq)
+        if closed[index] == mark:
+            continue  # Stale entry: this cell was already expanded with a lower g
+        closed[index] = mark
+        nodes_expanded += 1
+        if index == end_index:
+            path = reconstruct_path(parent, cols, index)
+            return path, nodes_expanded, time.perf_counter() - start_time  # Solution found
+
+        new_g = 1 - neg_g
+        for n_index in neighbors(index):  # Up, Down, Left, Right
+            if costs is not None:
+                new_g = costs[n_index] - neg_g
+            if closed[n_index] != mark and (seen[n_index] != mark or new_g < g_score[n_index]):
+                seen[n_index] = mark
+                g_score[n_index] = new_g
+                parent[n_index] = index
+                f = new_g + scale * heuristic_fn(divmod(n_index, cols), end)
+                heapq.heappush(pq, (f, -new_g, n_index))
+
+    return None, nodes_expanded, time.perf_counter() - start_time  # No solution found
+
+
+def dijkstra(maze, start, end):
+    """
+    Dijkstra's algorithm with a bucket queue (Dial's algorithm).
+    Step costs are small integers (grid.costs, 1-255; 1 everywhere on plain
+    grids), so tentative distances are kept in max_cost + 1 buckets used
+    circularly: every cell in the bucket for distance d is final when that
+    bucket is reached, and a neighbor lands at most max_cost buckets ahead.
+    Pushes and pops are O(1) list operations instead of O(log n) heap
+    operations. Cells whose distance improved after they were bucketed are
+    skipped when their outdated entry comes up (lazy deletion).
+    nodes_expanded counts settled cells.
+    Returns: (path, nodes_expanded, time_taken)
+    """
+    grid = as_grid(maze)
+    cols = grid.cols
+    start_index, end_index = grid.index(*start), grid.index(*end)
+    costs = grid.costs
+    width = grid.max_cost() + 1
+    parent = new_parent_array(grid.size)
+    dist = array('i', [UNREACHED]) * grid.size
+    dist[start_index] = 0
+    buckets = [[] for _ in range(width)]
+    buckets[0].append(start_index)
+    queued = 1  # Entries in all buckets, stale ones included
+    neighbors = grid.neighbors
+    nodes_expanded = 0
+    current = 0
+    start_time = time.perf_counter()
+
+    while queued:
+        bucket = buckets[current % width]
+        while bucket:
+            index = bucket.pop()
+            queued -= 1
+            if dist[index] != current:
+                continue  # Stale entry: a cheaper route was found after it was bucketed
+            nodes_expanded += 1
+            if index == end_index:
+                path = reconstruct_path(parent, cols, index)
+                return path, nodes_expanded, time.perf_counter() - start_time  # Solution found
+
+            for n_index in neighbors(index):  # Up, Down, Left, Right
+                new_dist = current + (costs[n_index] if costs is not None else 1)
+                if new_dist < dist[n_index]:
+                    dist[n_index] = new_dist
+                    parent[n_index] = index
+                    buckets[new_dist % width].append(n_index)
+                    queued += 1
+        current += 1
+
+    return None, nodes_expanded, time.perf_counter() - start_time  # No solution found
+
+
+def path_cost(maze, path):
+    """
+    Total cost of walking path: the sum of the step costs of every cell
+    entered after the start (len(path) - 1 on unweighted grids).
+    """
+    grid = as_grid(maze)
+    if grid.costs is None:
+        return len(path) - 1
+    return sum(grid.costs[grid.index(r, c)] for r, c in path[1:])
+
+
+# Step-streaming variants
+#
+# bfs_steps, dfs_steps and a_star_steps are generators that search exactly
+# like bfs, dfs and a_star but yield the expansions as they happen, in lists
+# of up to batch_size events
+#     ((row, col), frontier size, g, f)
+# where the frontier size counts queued entries after the pop (for A* that
+# includes not yet skipped stale heap entries) and f == g for BFS and DFS.
+# The generator's return value (StopIteration.value, or what run_steps
+# returns) is the usual (path, nodes_expanded, time_taken); time_taken only
+# counts time spent searching, not time the consumer spent between batches.
+# They are separate functions so the plain solvers pay nothing for them.
+
+STEP_BATCH = 256  # Default number of expansion events per yielded batch
+
+
+def bfs_steps(maze, start, end, batch_size=STEP_BATCH):
+    """
+    Breadth-First Search that yields batches of expansion events.
+    Returns: (path, nodes_expanded, time_taken)
+    """
+    grid = as_grid(maze)
+    cols = grid.cols
+    start_index, end_index = grid.index(*start), grid.index(*end)
+    parent = new_parent_array(grid.size)
+    dist = array('i', [UNREACHED]) * grid.size  # Doubles as the visited set
+    dist[start_index] = 0
+    queue = deque([start_index])
+    neighbors = grid.neighbors
+    nodes_expanded = 0
+    batch = []
+    elapsed, resumed = 0.0, time.perf_counter()
+
+    while queue:
+        index = queue.popleft()
+        nodes_expanded += 1
+        g = dist[index]
+        batch.append((divmod(index, cols), len(queue), g, g))
+        if index == end_index:
+            break
+
+        for n_index in neighbors(index):  # Up, Down, Left, Right
+            if dist[n_index] == UNREACHED:
+                dist[n_index] = g + 1
+                parent[n_index] = index
+                queue.append(n_index)
+        if len(batch) >= batch_size:
+            elapsed += time.perf_counter() - resumed
+            yield batch
+            batch = []
+            resumed = time.perf_counter()
+
+    path = reconstruct_path(parent, cols, end_index) if dist[end_index] != UNREACHED else None
+    elapsed += time.perf_counter() - resumed
+    if batch:
+        yield batch
+    return path, nodes_expanded, elapsed
+
+
+def dfs_steps(maze, start, end, batch_size=STEP_BATCH):
+    """
+    Depth-First Search that yields batches of expansion events;
+    g is the depth of the cell in the search tree.
+    Returns: (path, nodes_expanded, time_taken)
+    """
+    grid = as_grid(maze)
+    cols = grid.cols
+    start_index, end_index = grid.index(*start), grid.index(*end)
+    parent = new_parent_array(grid.size)
+    depth = array('i', [UNREACHED]) * grid.size  # Doubles as the visited set
+    depth[start_index] = 0
+    stack = [start_index]
+    neighbors = grid.neighbors
+    nodes_expanded = 0
+    batch = []
+    elapsed, resumed = 0.0, time.perf_counter()
+    found = False
+
+    while stack:
+        index = stack.pop()
+        nodes_expanded += 1
+        g = depth[index]
+        batch.append((divmod(index, cols), len(stack), g, g))
+        if index == end_index:
+            found = True
+            break
+
+        for n_index in neighbors(index):  # Up, Down, Left, Right
+            if depth[n_index] == UNREACHED:
+                depth[n_index] = g + 1
+                parent[n_index] = index
+                stack.append(n_index)
+        if len(batch) >= batch_size:
+            elapsed += time.perf_counter() - resumed
+            yield batch
+            batch = []
+            resumed = time.perf_counter()
+
+    path = reconstruct_path(parent, cols, end_index) if found else None
+    elapsed += time.perf_counter() - resumed
+    if batch:
+        yield batch
+    return path, nodes_expanded, elapsed
+
+
+def a_star_steps(maze, start, end, heuristic_fn=heuristic, batch_size=STEP_BATCH):
+    """
+    A* Search (as a_star, including weighted grids) that yields batches of
+    expansion events.
+    Returns: (path, nodes_expanded, time_taken)
+    """
+    if isinstance(heuristic_fn, str):
+        heuristic_fn = HEURISTICS[heuristic_fn]
+    grid = as_grid(maze)
+    cols = grid.cols
+    start_index, end_index = grid.index(*start), grid.index(*end)
+    parent = new_parent_array(grid.size)
+    g_score = array('i', [UNREACHED]) * grid.size
+    g_score[start_index] = 0
+    closed = bytearray(grid.size)
+    costs, scale = grid.costs, grid.min_cost()
+    pq = [(scale * heuristic_fn(start, end), 0, start_index)]  # (f, -g, index)
+    neighbors = grid.neighbors
+    nodes_expanded = 0
+    batch = []
+    elapsed, resumed = 0.0, time.perf_counter()
+
+    while pq:
+        f, neg_g, index = heapq.heappop(pq)
+        if closed[index]:
+            continue  # Stale entry: this cell was already expanded with a lower g
+        closed[index] = 1
+        nodes_expanded += 1
+        batch.append((divmod(index, cols), len(pq), -neg_g, f))
+        if index == end_index:
+            break
+
+        new_g = 1 - neg_g
+        for n_index in neighbors(index):  # Up, Down, Left, Right
+            if costs is not None:
+                new_g = costs[n_index] - neg_g
+            if not closed[n_index] and new_g < g_score[n_index]:
+                g_score[n_index] = new_g
+                parent[n_index] = index
+                heapq.heappush(pq, (new_g + scale * heuristic_fn(divmod(n_index, cols), end), -new_g, n_index))
+        if len(batch) >= batch_size:
+            elapsed += time.perf_counter() - resumed
+            yield batch
+            batch = []
+            resumed = time.perf_counter()
+
+    path = reconstruct_path(parent, cols, end_index) if closed[end_index] else None
+    elapsed += time.perf_counter() - resumed
+    if batch:
+        yield batch
+    return path, nodes_expanded, elapsed
+
+
+def run_steps(steps, on_batch=None):
+    """
+    Drives a step-streaming search to the end, passing every batch to
+    on_batch (if given). Returns the search's (path, nodes_expanded, time_taken).
+    """
+    while True:
+        try:
+            batch = next(steps)
+        except StopIteration as stop:
+            return stop.value
+        if on_batch is not None:
+            on_batch(batch)
+
+
+# Step-streaming variant of each solver that has one
+STEP_SOLVERS = {
+    bfs: bfs_steps,
+    dfs: dfs_steps,
+    a_star: a_star_steps,
+}
+
+
+def _wavefront(grid, start, stop_index=None):
+    """
+    Layered NumPy BFS from start over a wall-padded, flattened copy of grid.
+    With padding the four neighbors of every frontier cell are the frontier
+    index array shifted by -W, +W, -1, +1 (W = padded width), so each iteration
+    expands one whole layer with array operations only. Stops early once the
+    padded index stop_index has been reached.
+    Returns: (dist, width, nodes_expanded); dist holds padded layer numbers,
+    -1 for unreached cells.
+    """
+    rows, cols = grid.rows, grid.cols
+    width = cols + 2
+
+    # free[i] is True for open cells that have not been reached yet
+    free = np.zeros((rows + 2, width), dtype=bool)
+    free[1:-1, 1:-1] = grid.as_numpy() == 0
+    free = free.ravel()
+    dist = np.full(free.size, -1, dtype=np.int32)
+    start_index = (start[0] + 1) * width + start[1] + 1
+    free[start_index] = False
+    dist[start_index] = 0
+
+    offsets = np.array([-width, width, -1, 1])  # Up, Down, Left, Right
+    frontier = np.array([start_index])
+    layer = 0
+    nodes_expanded = 0
+
+    while frontier.size and (stop_index is None or dist[stop_index] < 0):
+        nodes_expanded += frontier.size
+        candidates = (frontier[:, None] + offsets).ravel()
+        candidates = candidates[free[candidates]]
+
+        # Drop duplicates (cells reached from two frontier cells) in O(k):
+        # the last write for each cell wins, so keep only that occurrence.
+        order = np.arange(candidates.size, dtype=np.int32)
+        dist[candidates] = order
+        candidates = candidates[dist[candidates] == order]
+
+        layer += 1
+        free[candidates] = False
+        dist[candidates] = layer
+        frontier = candidates
+
+    return dist, width, nodes_expanded
+
+
+def bfs_wavefront(maze, start, end):
+    """
+    Vectorized Breadth-First Search (requires NumPy).
+    Expands one whole BFS layer per iteration with array operations only
+    (see _wavefront), then backtracks the path through the distance field.
+    nodes_expanded counts every cell in the layers closer to start than the
+    goal, plus the goal itself (bfs also counts the cells of the goal's layer
+    it pops before the goal, so it can report more).
+    Returns: (path, nodes_expanded, time_taken)
+    """
+    if np is None:
+        raise ImportError("NumPy is required for bfs_wavefront")
+    grid = as_grid(maze)
+    start_time = time.perf_counter()
+    end_index = (end[0] + 1) * (grid.cols + 2) + end[1] + 1
+    dist, width, nodes_expanded = _wavefront(grid, start, end_index)
+    if dist[end_index] < 0:
+        return None, nodes_expanded, time.perf_counter() - start_time  # No solution found
+
+    # Backtrack from the goal by stepping to any neighbor one layer closer
+    indices = [end_index]
+    index = end_index
+    for d in range(int(dist[end_index]) - 1, -1, -1):
+        for offset in (-width, width, -1, 1):
+            if dist[index + offset] == d:
+                index += offset
+                break
+        indices.append(index)
+    path = [(index // width - 1, index % width - 1) for index in reversed(indices)]
+    return path, nodes_expanded + 1, time.perf_counter() - start_time  # Solution found
+
+
+def distance_field(maze, source):
+    """
+    BFS distance from source to every cell, as a flat int32 array indexed by
+    row * cols + col. Unreachable cells and walls hold UNREACHED.
+    Uses the vectorized wavefront when NumPy is available.
+    """
+    grid = as_grid(maze)
+    if np is not None:
+        dist, _, _ = _wavefront(grid, source)
+        dist = dist.reshape(grid.rows + 2, grid.cols + 2)[1:-1, 1:-1]
+        dist = np.where(dist < 0, UNREACHED, dist).astype(np.int32)
+        return array('i', dist.tobytes())
+
+    dist = array('i', [UNREACHED]) * grid.size
+    source_index = grid.index(*source)
+    dist[source_index] = 0
+    queue = deque([source_index])
+    neighbors = grid.neighbors
+    while queue:
+        index = queue.popleft()
+        new_dist = dist[index] + 1
+        for n_index in neighbors(index):
+            if dist[n_index] == UNREACHED:
+                dist[n_index] = new_dist
+                queue.append(n_index)
+    return dist
+
+
+def bidirectional_a_star(maze, start, end, heuristic_fn=heuristic):
+    """
+    Bidirectional A* Search: a forward A* from start and a backward A* from end
+    that meet in the middle. heuristic_fn is used as in a_star and must be
+    consistent. nodes_expanded counts both frontiers.
     Returns: (path, nodes_expanded, time_taken)
     """
-    rows, cols = len(maze), len(maze[0])
-    pq = [(0, start, [start])]  # (cost, position, path)
-    visited = set()
+    if isinstance(heuristic_fn, str):
+        heuristic_fn = HEURISTICS[heuristic_fn]
+    grid = as_grid(maze)
+    cols = grid.cols
+    start_index, end_index = grid.index(*start), grid.index(*end)
+    start_time = time.perf_counter()
+    if start_index == end_index:
+        return [start], 1, time.perf_counter() - start_time
+
+    # Both sides use the balanced heuristic p(n) = (h(n, end) - h(n, start)) / 2
+    # (negated backward), so they agree on every cell's potential and behave
+    # like one bidirectional Dijkstra: each frontier only grows towards the
+    # other. Keys are doubled to stay integral: 2g + h(n, end) - h(n, start)
+    # forward, 2g + h(n, start) - h(n, end) backward.
+    g_score = (array('i', [UNREACHED]) * grid.size, array('i', [UNREACHED]) * grid.size)
+    parent = (new_parent_array(grid.size), new_parent_array(grid.size))
+    closed = (bytearray(grid.size), bytearray(grid.size))
+    g_score[0][start_index] = 0
+    g_score[1][end_index] = 0
+    heaps = ([(heuristic_fn(start, end) - heuristic_fn(start, start), 0, start_index)],  # (key, -g, index)
+             [(heuristic_fn(end, end) - heuristic_fn(end, start), 0, end_index)])
+    signs = (1, -1)  # Sign of h(n, end) - h(n, start) in each side's key
+    neighbors = grid.neighbors
+    best, meet = UNREACHED, -1
     nodes_expanded = 0
+
+    while heaps[0] and heaps[1]:
+        # Every route not found yet costs at least half the two smallest keys
+        if 2 * best <= heaps[0][0][0] + heaps[1][0][0]:
+            break  # No unexplored route can beat the best meeting found
+        side = 0 if len(heaps[0]) <= len(heaps[1]) else 1  # Expand the smaller open list
+        heap, own_g, own_closed = heaps[side], g_score[side], closed[side]
+        _, neg_g, index = heapq.heappop(heap)
+        if own_closed[index]:
+            continue  # Stale entry
+        own_closed[index] = 1
+        nodes_expanded += 1
+
+        other_g, own_parent, sign = g_score[1 - side], parent[side], signs[side]
+        new_g = 1 - neg_g
+        for n_index in neighbors(index):
+            if not own_closed[n_index] and new_g < own_g[n_index]:
+                own_g[n_index] = new_g
+                own_parent[n_index] = index
+                cell = divmod(n_index, cols)
+                key = 2 * new_g + sign * (heuristic_fn(cell, end) - heuristic_fn(cell, start))
+                heapq.heappush(heap, (key, -new_g, n_index))
+                # A cell the other side has reached joins the two searches
+                if other_g[n_index] != UNREACHED and new_g + other_g[n_index] < best:
+                    best, meet = new_g + other_g[n_index], n_index
+
+    if meet == -1:
+        return None, nodes_expanded, time.perf_counter() - start_time  # No solution found
+    path = join_paths(parent[0], parent[1], cols, meet)
+    return path, nodes_expanded, time.perf_counter() - start_time  # Solution found
+
+
+FLIP_CELLS = bytes.maketrans(b"\x00\x01", b"\x01\x00")  # Wall bytes to open bytes and back
+
+
+def _jump_stops(grid):
+    """
+    (cells, right_stops, left_stops) for jps: cells with find/rfind and one
+    byte per cell marking where a rightward / leftward jump stops.
+    """
+    cells, cols, size = grid.cells, grid.cols, grid.size
+    if not hasattr(cells, "find"):
+        cells = bytes(cells)  # Memoryview-backed grids (mmap, shared memory)
+    # A rightward jump stops where a side row has an open cell with a wall to
+    # its left, a leftward jump where it has one with a wall to its right.
+    # The cells are read as big integers, so each mask is a few C-speed shifts
+    walls = int.from_bytes(cells, "big")
+    opens = int.from_bytes(cells.translate(FLIP_CELLS), "big")
+    # A cell's left/right neighbor in the next or previous row leaks into
+    # column 0 / the last column here; jumps never search those columns
+    rises = opens & (walls >> 8)
+    falls = opens & (walls << 8)
+    # Shifting by a row puts the row above and below in place; the bytes
+    # shifted past the first row are cut off
+    row_bits = 8 * cols
+    right_stops = ((rises >> row_bits) | (rises << row_bits)).to_bytes(size + cols, "big")[cols:]
+    left_stops = ((falls >> row_bits) | (falls << row_bits)).to_bytes(size + cols, "big")[cols:]
+    return cells, right_stops, left_stops
+
+
+def jps(maze, start, end):
+    """
+    Jump Point Search (4-connected variant): A* over jump points only, skipping
+    long open stretches instead of expanding them cell by cell.
+    nodes_expanded counts expanded jump points.
+    Returns: (path, nodes_expanded, time_taken)
+    """
+    grid = as_grid(maze)
+    cols, size = grid.cols, grid.size
+    start_index, end_index = grid.index(*start), grid.index(*end)
+    er, ec = end
     start_time = time.perf_counter()
+    # Forced-neighbor masks, built once per maze and reused until it is edited,
+    # so a horizontal jump is two bytes.find calls instead of a walk in Python
+    cells, right_stops, left_stops = grid.derived("jump_stops", _jump_stops)
+
+    # A jump goes straight until it reaches the goal, a dead end (no jump point)
+    # or a cell with a forced neighbor (a side opening closed one step back)
+    def jump_horizontal(index, dc):
+        """Index of the jump point a horizontal jump from index reaches, or -1."""
+        c = index % cols
+        if c + dc in (-1, cols) or cells[index + dc]:
+            return -1  # Blocked straight away, the common case in dense mazes
+        row = index - c
+        if dc > 0:
+            limit = cells.find(1, index + 1, row + cols)
+            if limit == -1:
+                limit = row + cols
+            point = right_stops.find(1, index + 1, limit)
+            if index < end_index < limit and (point == -1 or end_index < point):
+                point = end_index
+        else:
+            limit = cells.rfind(1, row, index)
+            if limit == -1:
+                limit = row - 1
+            point = left_stops.rfind(1, limit + 1, index)
+            if limit < end_index < index and end_index > point:
+                point = end_index
+        return point
+
+    # Vertical jumps also stop where a horizontal jump from that cell finds a
+    # jump point, remembered per cell: 0 unknown, 1 no jump point, 2 one exists
+    horizontal = bytearray(size)
+
+    def jump_vertical(index, step):
+        """Index of the jump point a vertical jump (step = +-cols) from index reaches, or -1."""
+        c = index % cols
+        has_left, has_right = c > 0, c < cols - 1
+        while True:
+            prev, index = index, index + step
+            if not 0 <= index < size or cells[index]:
+                return -1
+            if index == end_index:
+                return index
+            if ((has_left and not cells[index - 1] and cells[prev - 1]) or
+                    (has_right and not cells[index + 1] and cells[prev + 1])):
+                return index  # Forced neighbor left or right
+            state = horizontal[index]
+            if not state:
+                state = 2 if jump_horizontal(index, 1) != -1 or jump_horizontal(index, -1) != -1 else 1
+                horizontal[index] = state
+            if state == 2:
+                return index  # A horizontal jump from here finds a jump point
+
+    # Only jump points get a g-score and parent, so dicts beat full-grid arrays
+    g_score = {start_index: 0}
+    parent = {start_index: -1}
+    closed = bytearray(size)
+    pq = [(heuristic(start, end), 0, start_index)]  # (f, -g, index)
+    # Jump directions as flat index steps: all four from the start, both
+    # turns and straight on after a vertical move
+    all_steps = (-cols, cols, -1, 1)
+    turns_down, turns_up = (-1, 1, cols), (-1, 1, -cols)
+    heappush, heappop = heapq.heappush, heapq.heappop
+    nodes_expanded = 0
 
     while pq:
-        cost, (x, y), path = heapq.heappop(pq)
+        _, neg_g, index = heappop(pq)
+        if closed[index]:
+            continue  # Stale entry
+        closed[index] = 1
         nodes_expanded += 1
-        if (x, y) == end:
+        if index == end_index:
+            # Expand the straight segments between consecutive jump points
+            path = [end]
+            while parent[index] != -1:
+                prev = parent[index]
+                step = (1 if prev > index else -1) * (1 if prev // cols == index // cols else cols)
+                while index != prev:
+                    index += step
+                    path.append(divmod(index, cols))
+            path.reverse()
             return path, nodes_expanded, time.perf_counter() - start_time  # Solution found
 
-        if (x, y) in visited:
-            continue
-        visited.add((x, y))
+        prev = parent[index]
+        if prev == -1:
+            steps = all_steps
+        elif -cols < index - prev < cols:
+            # Arrived moving horizontally: go on, and turn only where the cell
+            # behind the turn is a wall (otherwise turning one cell earlier,
+            # vertical before horizontal, is just as short)
+            dc = 1 if index > prev else -1
+            back = index - dc
+            steps = []
+            if back >= cols and cells[back - cols]:
+                steps.append(-cols)
+            if back + cols < size and cells[back + cols]:
+                steps.append(cols)
+            steps.append(dc)
+        else:
+            steps = turns_down if index > prev else turns_up
 
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:  # Up, Down, Left, Right
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < rows and 0 <= ny < cols and maze[nx][ny] == 0 and (nx, ny) not in visited:
-                new_cost = cost + 1 + heuristic((nx, ny), end)
-                heapq.heappush(pq, (new_cost, (nx, ny), path + [(nx, ny)]))
+        g = -neg_g
+        r, c = divmod(index, cols)
+        for step in steps:
+            # Skip jumps that are blocked on their first step without a call
+            if -cols < step < cols:
+                if c + step in (-1, cols) or cells[index + step]:
+                    continue
+                point = jump_horizontal(index, step)
+                if point == -1 or closed[point]:
+                    continue
+                new_g = g + abs(point - index)
+                f = new_g + abs(r - er) + abs(point - index + c - ec)
+            else:
+                if not 0 <= index + step < size or cells[index + step]:
+                    continue
+                point = jump_vertical(index, step)
+                if point == -1 or closed[point]:
+                    continue
+                new_g = g + abs(point - index) // cols
+                f = new_g + abs((point - index) // cols + r - er) + abs(c - ec)
+            if new_g < g_score.get(point, UNREACHED):
+                g_score[point] = new_g
+                parent[point] = index
+                heappush(pq, (f, -new_g, point))
 
     return None, nodes_expanded, time.perf_counter() - start_time  # No solution found
 
 
+class IncrementalSolver:
+    """
+    Lifelong Planning A* (LPA*) between a fixed start and end.
+    Keeps its g/rhs tables and priority queue between calls, so after a few
+    cells are toggled solve() only repairs the part of the search those edits
+    invalidated instead of searching from scratch.
+    g is the current cost-from-start estimate of a cell and rhs the one-step
+    lookahead (best open neighbor's g plus the cost of stepping onto the cell:
+    1, or its step cost on weighted grids, as in a_star); cells where they
+    differ are queued.
+    The grid is shared, not copied: change cells through toggle(), or call
+    update_cell() after changing the grid directly.
+    """
+
+    def __init__(self, maze, start, end, heuristic_fn=heuristic):
+        self.grid = as_grid(maze)
+        self.start, self.end = start, end
+        self.heuristic_fn = heuristic_fn
+        self.scale = self.grid.min_cost()  # Keeps the heuristic consistent on weighted grids
+        self.start_index = self.grid.index(*start)
+        self.end_index = self.grid.index(*end)
+        self.g = array('i', [UNREACHED]) * self.grid.size
+        self.rhs = array('i', [UNREACHED]) * self.grid.size
+        self.rhs[self.start_index] = 0
+        self.queue = [self._key(self.start_index) + (self.start_index,)]
+
+    def _key(self, index):
+        best = min(self.g[index], self.rhs[index])
+        return best + self.scale * self.heuristic_fn(divmod(index, self.grid.cols), self.end), best
+
+    def _update_vertex(self, index):
+        grid, g = self.grid, self.g
+        if index != self.start_index:
+            best = UNREACHED
+            if grid.cells[index] == 0:
+                for n_index in grid.neighbors(index):
+                    if g[n_index] < best:
+                        best = g[n_index]
+                if best != UNREACHED:
+                    best += 1 if grid.costs is None else grid.costs[index]
+            self.rhs[index] = best
+        if g[index] != self.rhs[index]:
+            heapq.heappush(self.queue, self._key(index) + (index,))
+
+    def _pop_stale(self):
+        """Drops queue entries for cells that are consistent or whose key changed."""
+        queue, g, rhs = self.queue, self.g, self.rhs
+        while queue:
+            k1, k2, index = queue[0]
+            if g[index] != rhs[index] and (k1, k2) == self._key(index):
+                return
+            heapq.heappop(queue)
+
+    def toggle(self, row, col):
+        """Flips a cell between wall and open path and records the change."""
+        self.grid.toggle(row, col)
+        self.update_cell(row, col)
+
+    def update_cell(self, row, col):
+        """Updates the search state after cell (row, col) changed in the grid."""
+        index = self.grid.index(row, col)
+        self._update_vertex(index)
+        # Neighbors' lookahead depends on this cell whether it is open or not
+        grid = self.grid
+        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+            if grid.in_bounds(row + dr, col + dc):
+                self._update_vertex(grid.index(row + dr, col + dc))
+
+    def solve(self):
+        """
+        Brings the search up to date and extracts the shortest path.
+        nodes_expanded counts the cells processed by this call only.
+        Returns: (path, nodes_expanded, time_taken)
+        """
+        g, rhs, queue = self.g, self.rhs, self.queue
+        end_index = self.end_index
+        neighbors = self.grid.neighbors
+        nodes_expanded = 0
+        start_time = time.perf_counter()
+
+        while True:
+            self._pop_stale()
+            if not queue:
+                break
+            if queue[0][:2] >= self._key(end_index) and g[end_index] == rhs[end_index]:
+                break
+            _, _, index = heapq.heappop(queue)
+            nodes_expanded += 1
+            if g[index] > rhs[index]:
+                g[index] = rhs[index]  # Overconsistent: settle the lower cost
+                for n_index in neighbors(index):
+                    self._update_vertex(n_index)
+            else:
+                g[index] = UNREACHED  # Underconsistent: reset and re-derive
+                self._update_vertex(index)
+                for n_index in neighbors(index):
+                    self._update_vertex(n_index)
+
+        if g[end_index] == UNREACHED:
+            return None, nodes_expanded, time.perf_counter() - start_time  # No solution found
+        # Walk back from the end along cells whose g drops by exactly the step cost
+        cols, costs = self.grid.cols, self.grid.costs
+        path = [self.end]
+        index = end_index
+        while index != self.start_index:
+            previous_g = g[index] - (1 if costs is None else costs[index])
+            for n_index in neighbors(index):
+                if g[n_index] == previous_g:
+                    index = n_index
+                    break
+            path.append(divmod(index, cols))
+        path.reverse()
+        return path, nodes_expanded, time.perf_counter() - start_time  # Solution found
+
+
+# Solvers available to compare_algorithms and the GUI, keyed by display name
+ALGORITHMS = {
+    "BFS": bfs,
+    "DFS": dfs,
+    "A*": a_star,
+    "JPS": jps,
+    "Bi-BFS": bidirectional_bfs,
+    "Bi-A*": bidirectional_a_star,
+    "Corridor A*": corridor_a_star,
+    "Dijkstra": dijkstra,
+}
+if np is not None:
+    ALGORITHMS["BFS (NumPy)"] = bfs_wavefront
+
+
 def compare_algorithms(maze, start, end):
     """
-    Runs all three algorithms on the same maze and prints comparison results.
+    Runs every algorithm in ALGORITHMS on the same maze and prints comparison results.
     """
+    maze = as_grid(maze)
     print("\n=== Algorithm Comparison ===")
-    print(f"Maze Size: {len(maze)}x{len(maze[0])}")
+    print(f"Maze Size: {maze.rows}x{maze.cols}")
     print(f"Start: {start}, End: {end}\n")
     
-    # Run all algorithms
-    bfs_path, bfs_nodes, bfs_time = bfs(maze, start, end)
-    dfs_path, dfs_nodes, dfs_time = dfs(maze, start, end)
-    astar_path, astar_nodes, astar_time = a_star(maze, start, end)
-    
     # Print comparison table
-    print(f"{'Algorithm':<10}{'Path Length':<15}{'Nodes Expanded':<15}{'Time (ms)':<10}")
-    print("-" * 50)
-    print(f"{'BFS':<10}{len(bfs_path) if bfs_path else 'N/A':<15}{bfs_nodes:<15}{bfs_time*1000:.2f}")
-    print(f"{'DFS':<10}{len(dfs_path) if dfs_path else 'N/A':<15}{dfs_nodes:<15}{dfs_time*1000:.2f}")
-    print(f"{'A*':<10}{len(astar_path) if astar_path else 'N/A':<15}{astar_nodes:<15}{astar_time*1000:.2f}")
+    print(f"{'Algorithm':<14}{'Path Length':<15}{'Nodes Expanded':<15}{'Time (ms)':<10}")
+    print("-" * 54)
+    for name, solver in ALGORITHMS.items():
+        path, nodes, time_taken = solver(maze, start, end)
+        print(f"{name:<14}{len(path) if path else 'N/A':<15}{nodes:<15}{time_taken*1000:.2f}")
 
 # Example Usage
 if __name__ == "__main__":
@@ -0,0 +1,220 @@
+import hashlib
+import os
+import struct
+import sys
+import threading
+from array import array
+from collections import OrderedDict, namedtuple
+from grid import as_grid
+from search_algorithms import ALGORITHMS
+
+CACHE_ENTRIES = 256  # Most results kept in memory
+CACHE_BYTES = 64 * 2**20  # Most path data (4 bytes per path cell) kept in memory
+
+# Disk entry (.solve): a 32-byte little-endian header followed by the path as
+# int32 flat cell indices:
+#   magic "MSLV", version, flags, reserved, nodes expanded (int64),
+#   time taken in seconds (float64), path length, reserved (uint32)
+ENTRY_MAGIC = b"MSLV"
+ENTRY_VERSION = 1
+FLAG_SOLVED = 0x01
+ENTRY_HEADER = struct.Struct("<4sBBHqdII")
+
+CacheInfo = namedtuple("CacheInfo", "hits misses disk_hits evictions entries nbytes")
+
+class SolveCache:
+    """
+    LRU cache of solver results keyed by maze content rather than identity:
+    (Grid.digest(), start, end, algorithm). Re-solving an unchanged maze, a
+    maze whose edits were toggled back, or a duplicate maze from another file
+    returns the stored (path, nodes_expanded, time_taken) without running the
+    solver; time_taken is that of the solve that produced the result.
+    Editing a grid through Grid.toggle() changes its digest, so results for
+    the old layout are never returned for it again and simply age out.
+    Algorithms are ALGORITHMS names or solver functions.
+    The memory tier holds at most max_entries results and max_bytes of path
+    data, evicting the least recently used first. With a directory, every
+    result is also written there (one file per key) and read back on memory
+    misses, so worker processes and later runs share results. The disk tier
+    is not size-bounded; clear(disk=True) empties it.
+    All methods are thread-safe.
+    """
+
+    def __init__(self, max_entries=CACHE_ENTRIES, max_bytes=CACHE_BYTES, directory=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.entries = OrderedDict()  # key -> (path indices or None, nodes_expanded, time_taken)
+        self.nbytes = 0
+        self.hits = self.misses = self.disk_hits = self.evictions = 0
+        self.lock = threading.Lock()
+
+    def key(self, maze, start, end, algorithm):
+        """Returns the cache key of a query as bytes."""
+        return (as_grid(maze).digest() + struct.pack("<4I", *start, *end)
+                + _algorithm_name(algorithm).encode("utf-8"))
+
+    def lookup(self, maze, start, end, algorithm):
+        """Returns the cached result of a query, or None (counted as a miss)."""
+        grid = as_grid(maze)
+        key = self.key(grid, start, end, algorithm)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+        if entry is None and self.directory is not None:
+            entry = self._read(key)
+            if entry is not None:
+                with self.lock:
+                    self.disk_hits += 1
+                    self.hits += 1
+                    self._insert(key, entry)
+        if entry is None:
+            with self.lock:
+                self.misses += 1
+            return None
+        indices, nodes_expanded, time_taken = entry
+        path = None if indices is None else [divmod(index, grid.cols) for index in indices]
+        return path, nodes_expanded, time_taken
+
+    def store(self, maze, start, end, algorithm, result):
+        """Stores the result of a query in memory and, if enabled, on disk."""
+        grid = as_grid(maze)
+        key = self.key(grid, start, end, algorithm)
+        path, nodes_expanded, time_taken = result
+        indices = None if path is None else array('i', [r * grid.cols + c for r, c in path])
+        entry = (indices, nodes_expanded, time_taken)
+        with self.lock:
+            self._insert(key, entry)
+        if self.directory is not None:
+            self._write(key, entry)
+
+    def solve(self, maze, start, end, algorithm, **kwargs):
+        """
+        Returns the cached result of a query, running and caching the solver on
+        a miss. Keyword arguments go to the solver and must not change its
+        result (e.g. a SolverWorkspace).
+        Returns: (path, nodes_expanded, time_taken)
+        """
+        grid = as_grid(maze)
+        result = self.lookup(grid, start, end, algorithm)
+        if result is None:
+            solver = ALGORITHMS[algorithm] if isinstance(algorithm, str) else algorithm
+            result = solver(grid, start, end, **kwargs)
+            self.store(grid, start, end, algorithm, result)
+        return result
+
+    def info(self):
+        """Returns hit/miss statistics and the memory tier's size as a CacheInfo."""
+        with self.lock:
+            return CacheInfo(self.hits, self.misses, self.disk_hits, self.evictions,
+                             len(self.entries), self.nbytes)
+
+    def clear(self, disk=False):
+        """Empties the memory tier (and the disk tier with disk=True) and resets the statistics."""
+        with self.lock:
+            self.entries.clear()
+            self.nbytes = 0
+            self.hits = self.misses = self.disk_hits = self.evictions = 0
+        if disk and self.directory is not None and os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name.endswith(".solve"):
+                    os.remove(os.path.join(self.directory, name))
+
+    def _insert(self, key, entry):
+        """Adds an entry and evicts least recently used ones (lock held)."""
+        old = self.entries.pop(key, None)
+        if old is not None:
+            self.nbytes -= _entry_bytes(old)
+        size = _entry_bytes(entry)
+        if size > self.max_bytes:
+            return  # Larger than the whole memory tier
+        self.entries[key] = entry
+        self.nbytes += size
+        while len(self.entries) > self.max_entries or self.nbytes > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.nbytes -= _entry_bytes(evicted)
+            self.evictions += 1
+
+    def _file(self, key):
+        return os.path.join(self.directory, hashlib.blake2b(key, digest_size=16).hexdigest() + ".solve")
+
+    def _read(self, key):
+        """Reads a disk entry; missing, foreign or damaged files count as misses."""
+        try:
+            with open(self._file(key), "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+        if len(data) < ENTRY_HEADER.size:
+            return None
+        magic, version, flags, _, nodes_expanded, time_taken, length, _ = ENTRY_HEADER.unpack_from(data)
+        if magic != ENTRY_MAGIC or version != ENTRY_VERSION:
+            return None
+        indices = array('i', data[ENTRY_HEADER.size:ENTRY_HEADER.size + 4 * length])
+        if len(indices) != length:
+            return None
+        if sys.byteorder == "big":
+            indices.byteswap()
+        return (indices if flags & FLAG_SOLVED else None), nodes_expanded, time_taken
+
+    def _write(self, key, entry):
+        """Writes a disk entry atomically, so concurrent readers never see half a file."""
+        indices, nodes_expanded, time_taken = entry
+        payload = array('i', indices or ())
+        if sys.byteorder == "big":
+            payload.byteswap()
+        header = ENTRY_HEADER.pack(ENTRY_MAGIC, ENTRY_VERSION, FLAG_SOLVED if indices is not None else 0,
+                                   0, nodes_expanded, time_taken, len(payload), 0)
+        path = self._file(key)
+        temp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(temp, "wb") as f:
+                f.write(header)
+                f.write(payload.tobytes())
+            os.replace(temp, path)
+        except OSError:
+            pass  # The disk tier is best effort; the result is still cached in memory
+
+def _algorithm_name(algorithm):
+    """ALGORITHMS name of a solver (or the name itself); other functions by qualified name."""
+    if isinstance(algorithm, str):
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm {algorithm!r}")
+        return algorithm
+    for name, solver in ALGORITHMS.items():
+        if solver is algorithm:
+            return name
+    return f"{algorithm.__module__}.{algorithm.__qualname__}"
+
+def _entry_bytes(entry):
+    indices = entry[0]
+    return 0 if indices is None else 4 * len(indices)
+
+# Process-wide cache shared by the GUI and batch workers
+default_cache = SolveCache()
+
+def cached_solve(maze, start, end, algorithm, **kwargs):
+    """
+    Solves through the process-wide cache (see SolveCache.solve).
+    Returns: (path, nodes_expanded, time_taken)
+    """
+    return default_cache.solve(maze, start, end, algorithm, **kwargs)
+
+# Example Usage
+if __name__ == "__main__":
+    import time
+    from maze import generate_maze
+    maze = generate_maze(300, 300, 'easy', seed=1)
+    start, end = (0, 0), (299, 299)
+    print(f"{'Query':<20}{'Path Length':<15}{'Wall Time (ms)':<15}")
+    for label, cell in [("A*", None), ("A* again", None), ("A* after an edit", (150, 151)),
+                        ("A* edit undone", (150, 151))]:
+        if cell:
+            maze.toggle(*cell)
+        start_time = time.perf_counter()
+        path, nodes, time_taken = cached_solve(maze, start, end, "A*")
+        print(f"{label:<20}{len(path) if path else 'N/A':<15}{(time.perf_counter() - start_time)*1000:.2f}")
+    print(default_cache.info())